@@ -30,10 +30,12 @@ from sphinx.application import Sphinx
 from sphinx.util import logging
 
 from ansys_sphinx_theme.cheatsheet import build_quarto_cheatsheet, cheatsheet_sidebar_pages
+from ansys_sphinx_theme.compression import compress_files, default_compression_formats
 from ansys_sphinx_theme.extension.linkcode import DOMAIN_KEYS, sphinx_linkcode_resolve
 from ansys_sphinx_theme.latex import generate_404
 from ansys_sphinx_theme.navbar_dropdown import load_navbar_configuration, update_template_context
 from ansys_sphinx_theme.search import (
+    collect_search_index,
     create_search_index,
     update_search_config,
 )
@@ -602,6 +604,50 @@ def add_tooltip_after_build(app: Sphinx, exception):
             html_file.write_text(new_text, encoding="utf-8")
 
 
+def precompress_build_files(app: Sphinx, exception):
+    """Write compressed siblings of the search index and of the theme static files.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance for rendering the documentation.
+    exception : Exception
+        Exception raised during the build process.
+
+    Notes
+    -----
+    The ``precompress`` theme option is either ``True`` or a dictionary with the
+    ``formats`` to write and whether to also compress the ``html`` files. Only the
+    output of HTML builders is compressed.
+    """
+    if exception or app.builder.format != "html":
+        return
+
+    precompress_options = app.config.html_theme_options.get("precompress")
+    if not precompress_options:
+        return
+    if not isinstance(precompress_options, dict):
+        precompress_options = {}
+
+    outdir = pathlib.Path(app.outdir)
+    static_dir = outdir / "_static"
+
+    # Search index files and theme static files, as copied in the build directory
+    file_paths = [static_dir / "search.json", *(static_dir / "search-index").glob("*json")]
+    file_paths.extend(
+        static_dir / path.relative_to(STATIC_PATH)
+        for path in STATIC_PATH.rglob("*")
+        if path.suffix in (".css", ".js")
+    )
+    if precompress_options.get("html", False):
+        file_paths.extend(outdir.rglob("*.html"))
+    file_paths = [path for path in file_paths if path.is_file()]
+
+    formats = precompress_options.get("formats", default_compression_formats())
+    written = compress_files(file_paths, formats)
+    logger.info(f"Precompressed {written} files with {', '.join(formats)}")
+
+
 def add_default_copyright(app: Sphinx) -> None:
     """Add a default copyright notice to the Sphinx configuration.
 
@@ -679,7 +725,11 @@ def setup(app: Sphinx) -> dict:
     app.connect("build-finished", replace_html_tag)
     app.connect("build-finished", add_tooltip_after_build)
     if use_ansys_search:
+        # Run after the other handlers that modify the resolved doctree
+        app.connect("doctree-resolved", collect_search_index, priority=900)
         app.connect("build-finished", create_search_index)
+    # Compress the files once every other step has modified them
+    app.connect("build-finished", precompress_build_files, priority=900)
 
     return {
         "version": __version__,
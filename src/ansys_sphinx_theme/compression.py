@@ -0,0 +1,142 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for precompressing the files of the HTML build.
+
+Web servers such as ``nginx`` with ``gzip_static`` and ``brotli_static`` serve the
+``.gz`` and ``.br`` siblings of a file directly, instead of compressing it on the fly.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import pathlib
+from typing import Callable, Iterable
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_FORMATS = ("gzip", "br")
+
+
+def get_compressors(formats: Iterable[str]) -> dict[str, Callable[[bytes], bytes]]:
+    """Get the compression function of each format.
+
+    Parameters
+    ----------
+    formats : Iterable[str]
+        Compression formats. Supported formats are ``"gzip"`` and ``"br"``.
+
+    Returns
+    -------
+    dict[str, Callable[[bytes], bytes]]
+        Compression function of each format, indexed by the suffix of the compressed files.
+    """
+    compressors = {}
+    for compression_format in formats:
+        if compression_format == "gzip":
+            # A fixed modification time makes the output reproducible
+            compressors[".gz"] = lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+        elif compression_format == "br":
+            try:
+                import brotli
+            except ImportError as e:
+                raise ImportError(
+                    f"Failed to import `brotli`: {e}. Install the package using `pip install brotli`"  # noqa: E501
+                )
+            compressors[".br"] = lambda data: brotli.compress(data, quality=11)
+        else:
+            raise ValueError(
+                f"Invalid compression format: '{compression_format}'. "
+                f"Supported formats are: {', '.join(COMPRESSION_FORMATS)}."
+            )
+    return compressors
+
+
+def default_compression_formats() -> list[str]:
+    """Get the compression formats available in the current environment.
+
+    Returns
+    -------
+    list[str]
+        ``"gzip"``, and ``"br"`` if the ``brotli`` package is installed.
+    """
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return ["gzip"]
+    return ["gzip", "br"]
+
+
+def compress_file(file_path: pathlib.Path, compressors: dict[str, Callable[[bytes], bytes]]) -> int:
+    """Write the compressed siblings of a file.
+
+    Siblings that are more recent than the file are kept as they are. Siblings that
+    would not be smaller than the file are not written.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Path to the file to compress.
+    compressors : dict[str, Callable[[bytes], bytes]]
+        Compression function of each suffix.
+
+    Returns
+    -------
+    int
+        Number of compressed files written.
+    """
+    written = 0
+    data = None
+    source_mtime = file_path.stat().st_mtime_ns
+    for suffix, compress in compressors.items():
+        compressed_path = file_path.with_name(file_path.name + suffix)
+        if compressed_path.exists() and compressed_path.stat().st_mtime_ns >= source_mtime:
+            continue
+        if data is None:
+            data = file_path.read_bytes()
+        compressed_data = compress(data)
+        if len(compressed_data) >= len(data):
+            compressed_path.unlink(missing_ok=True)
+            continue
+        compressed_path.write_bytes(compressed_data)
+        written += 1
+    return written
+
+
+def compress_files(
+    file_paths: Iterable[pathlib.Path], formats: Iterable[str], max_workers: int | None = None
+) -> int:
+    """Write the compressed siblings of several files using a pool of threads.
+
+    Parameters
+    ----------
+    file_paths : Iterable[pathlib.Path]
+        Paths to the files to compress.
+    formats : Iterable[str]
+        Compression formats.
+    max_workers : int, optional
+        Maximum number of threads. The default is the default of ``ThreadPoolExecutor``.
+
+    Returns
+    -------
+    int
+        Number of compressed files written.
+    """
+    compressors = get_compressors(formats)
+    # zlib releases the GIL while compressing, so files are compressed concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(lambda path: compress_file(path, compressors), file_paths))
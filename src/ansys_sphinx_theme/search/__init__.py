@@ -19,6 +19,7 @@
 from sphinx.application import Sphinx
 
 from ansys_sphinx_theme.search.fuse_search import (
+    collect_search_index,
     create_search_index,
 )
 
@@ -32,13 +33,16 @@ def update_search_config(app: Sphinx) -> None:
         Sphinx application.
     """
     theme_static_options = app.config.html_theme_options.get("static_search", {})
-    theme_static_options["keys"] = ["title", "text", "objectID"]
+    # Normalized entries are matched on their normalized terms instead of their text
+    text_key = "match" if theme_static_options.get("normalize", False) else "text"
+    theme_static_options["keys"] = ["title", text_key, "objectID"]
     theme_static_options["threshold"] = theme_static_options.get("threshold", 0.2)
     theme_static_options["limit"] = theme_static_options.get("limit", 10)
     app.config.html_theme_options["static_search"] = theme_static_options
 
 
 __all__ = [
+    "collect_search_index",
     "create_search_index",
     "update_search_config",
 ]
@@ -0,0 +1,129 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for generating an inverted index with BM25 scores for the search."""
+
+import math
+import re
+
+# Keep in sync with ``tokenize`` in ``search-utils.js``
+TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Each occurrence of a term in the title counts as this many occurrences in the text
+TITLE_BOOST = 3
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into lowercase terms.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+
+    Returns
+    -------
+    list[str]
+        Terms of the text.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25IndexBuilder:
+    """Build an inverted index with precomputed BM25 scores one entry at a time.
+
+    Only the term frequencies of the entries are kept in memory, not their text.
+    """
+
+    def __init__(self, normalizer=None):
+        """
+        Initialize an empty index.
+
+        Parameters
+        ----------
+        normalizer : TextNormalizer, optional
+            Normalizer of the entries. The titles are normalized with it, like the
+            queries, when the entries are normalized.
+        """
+        self.normalizer = normalizer
+        self.term_frequencies = []
+        self.lengths = []
+
+    def add(self, entry: dict):
+        """
+        Add a search index entry to the index.
+
+        Parameters
+        ----------
+        entry : dict
+            Search index entry, as written in ``search.json``.
+        """
+        frequencies = {}
+        # Normalized entries are searched with normalized queries
+        for term in tokenize(entry.get("match", entry["text"])):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        title = entry["title"]
+        if self.normalizer is not None:
+            title = self.normalizer.normalize(title)
+        for term in tokenize(title):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_BOOST
+        self.term_frequencies.append(frequencies)
+        self.lengths.append(sum(frequencies.values()))
+
+    def build(self) -> dict:
+        """
+        Build the inverted index of the entries added so far.
+
+        Returns
+        -------
+        dict
+            Inverted index. ``terms`` is the sorted list of terms and ``postings``
+            contains, for each term, a flat list alternating the position of an entry in
+            ``search.json`` and the BM25 score of the term for this entry.
+
+        Notes
+        -----
+        Since the score of a query is the sum of the scores of its terms, the whole
+        BM25 formula is evaluated at build time. The client only adds up the scores
+        found in the postings of the query terms.
+        """
+        entries_count = len(self.lengths)
+        average_length = sum(self.lengths) / entries_count if entries_count else 0
+
+        postings = {}
+        for position, frequencies in enumerate(self.term_frequencies):
+            length_norm = 1 - BM25_B + BM25_B * self.lengths[position] / (average_length or 1)
+            for term, frequency in frequencies.items():
+                weight = frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                postings.setdefault(term, []).append((position, weight))
+
+        terms = sorted(postings)
+        index_postings = []
+        for term in terms:
+            term_postings = postings[term]
+            document_frequency = len(term_postings)
+            idf = math.log(
+                1 + (entries_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            flat_postings = []
+            for position, weight in term_postings:
+                flat_postings.extend((position, round(idf * weight, 3)))
+            index_postings.append(flat_postings)
+
+        return {"terms": terms, "postings": index_postings}
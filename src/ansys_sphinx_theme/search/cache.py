@@ -0,0 +1,222 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for caching the search index entries between builds."""
+
+import hashlib
+import importlib.metadata as importlib_metadata
+import json
+from pathlib import Path
+import pickle
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+# Increase this value whenever the format of the search index entries changes
+SEARCH_INDEX_CACHE_VERSION = 3
+SEARCH_INDEX_CACHE_DIR = "ansys_sphinx_theme_search"
+SEARCH_INDEX_CACHE_MANIFEST = "manifest.pickle"
+# Subdirectory of the shards, so that no document name collides with the manifest
+SEARCH_INDEX_CACHE_DOCS_DIR = "docs"
+# Keys of the ``static_search`` option that change the entries extracted from a
+# document. Other keys only affect the files written from the entries or the client.
+SEARCH_INDEX_ENTRY_OPTIONS = (
+    "max_text_length",
+    "exclude_node_types",
+    "include_node_types",
+    "full_text",
+    "dedup",
+    "dedup_ratio",
+    "normalize",
+    "symbol_index",
+    "title_index",
+)
+
+
+class SearchIndexCache:
+    """Persist the search index entries of each document under the doctree directory.
+
+    Each document has its own shard file containing its search index entries. A
+    manifest keeps the signature of every cached document, that is the modification
+    time of its doctree and the titles used to build its breadcrumbs. A document
+    whose signature changes is indexed again on the next build.
+    """
+
+    def __init__(self, app, static_search_options, filter_options, cache_dir=None):
+        """
+        Initialize the search index cache.
+
+        Parameters
+        ----------
+        app : Sphinx
+            Sphinx application instance.
+        static_search_options : dict
+            Options of the ``static_search`` theme option.
+        filter_options : dict
+            Search filters used to compute the ``objectID`` of each entry.
+        cache_dir : str or pathlib.Path, optional
+            Directory of the cache. By default, the cache is kept under the doctree
+            directory, so that it persists between builds.
+        """
+        self.env = app.env
+        self.doctree_dir = Path(app.doctreedir)
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir is not None else self.doctree_dir / SEARCH_INDEX_CACHE_DIR
+        )
+        self.manifest_path = self.cache_dir / SEARCH_INDEX_CACHE_MANIFEST
+        language = app.config.html_search_language or app.config.language
+        self.key = _cache_key(static_search_options, filter_options, language)
+        self.signatures = self._load_manifest()
+
+    def _load_manifest(self):
+        """Load the signatures of the cached documents."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with self.manifest_path.open("rb") as manifest_file:
+                manifest = pickle.load(manifest_file)
+        except Exception as e:
+            logger.warning(f"Ignoring the search index cache: {e}")
+            return {}
+        # Options affecting the entries changed, so every document is outdated
+        if manifest.get("key") != self.key:
+            return {}
+        return manifest.get("documents", {})
+
+    def _shard_path(self, docname):
+        """Get the path of the shard containing the entries of a document."""
+        return self.cache_dir / SEARCH_INDEX_CACHE_DOCS_DIR / f"{docname}.pickle"
+
+    def signature(self, docname):
+        """
+        Get the signature of a document.
+
+        Parameters
+        ----------
+        docname : str
+            Name of the document.
+
+        Returns
+        -------
+        tuple or None
+            Signature of the document, or ``None`` if its doctree is not available.
+        """
+        try:
+            stat = (self.doctree_dir / f"{docname}.doctree").stat()
+        except OSError:
+            return None
+        # Breadcrumbs and parent titles are resolved from the titles of each part
+        parts = docname.split("/")
+        titles = tuple(
+            self.env.titles[part].astext() if part in self.env.titles else None for part in parts
+        )
+        return (stat.st_mtime_ns, stat.st_size, titles)
+
+    def outdated(self, docnames):
+        """
+        Get the documents that must be indexed again.
+
+        Parameters
+        ----------
+        docnames : list[str]
+            Names of the documents included in the search index.
+
+        Returns
+        -------
+        list[str]
+            Documents that are new or whose signature changed since the last build.
+        """
+        return [
+            docname
+            for docname in docnames
+            if self.signatures.get(docname) is None
+            or self.signatures[docname] != self.signature(docname)
+            or not self._shard_path(docname).exists()
+        ]
+
+    def load(self, docname):
+        """
+        Load the cached entries of a document.
+
+        Parameters
+        ----------
+        docname : str
+            Name of the document.
+
+        Returns
+        -------
+        list[dict]
+            Search index entries of the document.
+        """
+        with self._shard_path(docname).open("rb") as shard_file:
+            return pickle.load(shard_file)
+
+    def store(self, docname, entries):
+        """
+        Store the entries of a document.
+
+        Parameters
+        ----------
+        docname : str
+            Name of the document.
+        entries : list[dict]
+            Search index entries of the document.
+        """
+        shard_path = self._shard_path(docname)
+        shard_path.parent.mkdir(parents=True, exist_ok=True)
+        with shard_path.open("wb") as shard_file:
+            pickle.dump(entries, shard_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.signatures[docname] = self.signature(docname)
+
+    def prune(self, docnames):
+        """
+        Drop the documents that are no longer part of the search index.
+
+        Parameters
+        ----------
+        docnames : list[str]
+            Names of the documents included in the search index.
+        """
+        for docname in set(self.signatures) - set(docnames):
+            del self.signatures[docname]
+            self._shard_path(docname).unlink(missing_ok=True)
+
+    def save(self):
+        """Save the signatures of the cached documents."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self.manifest_path.open("wb") as manifest_file:
+            pickle.dump(
+                {"key": self.key, "documents": self.signatures},
+                manifest_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+
+def _cache_key(static_search_options, filter_options, language=None):
+    """Compute a key that changes whenever the options affecting the entries change."""
+    entry_options = {key: static_search_options.get(key) for key in SEARCH_INDEX_ENTRY_OPTIONS}
+    options = {
+        "version": SEARCH_INDEX_CACHE_VERSION,
+        # Other versions of the theme may extract different entries
+        "theme_version": importlib_metadata.version("ansys-sphinx-theme"),
+        "static_search": entry_options,
+        "search_filters": filter_options,
+        # Used to normalize the text of the entries
+        "language": language,
+    }
+    serialized_options = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_options.encode("utf-8")).hexdigest()
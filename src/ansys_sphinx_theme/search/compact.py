@@ -0,0 +1,127 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for encoding the search index entries in a compact columnar format."""
+
+COMPACT_FORMAT_VERSION = 1
+BREADCRUMB_SEPARATOR = " > "
+
+
+class StringTable:
+    """Table of unique strings referenced by their position."""
+
+    def __init__(self):
+        """Initialize an empty string table."""
+        self.strings = []
+        self.positions = {}
+
+    def add(self, value: str) -> int:
+        """
+        Get the position of a string, adding it to the table if needed.
+
+        Parameters
+        ----------
+        value : str
+            String to add.
+
+        Returns
+        -------
+        int
+            Position of the string in the table.
+        """
+        position = self.positions.get(value)
+        if position is None:
+            position = self.positions[value] = len(self.strings)
+            self.strings.append(value)
+        return position
+
+
+class CompactIndexEncoder:
+    """Encode search index entries in the compact columnar format one at a time."""
+
+    def __init__(self):
+        """Initialize an empty compact index."""
+        self.object_ids = StringTable()
+        self.documents = StringTable()
+        self.prefixes = StringTable()
+        self.columns = {
+            "objectID": [],
+            "document": [],
+            "anchor": [],
+            "prefix": [],
+            "title": [],
+            "text": [],
+        }
+
+    def add(self, entry: dict):
+        """
+        Add a search index entry to the compact index.
+
+        Parameters
+        ----------
+        entry : dict
+            Search index entry, as written in ``search.json``.
+        """
+        document, _, anchor = entry["href"].partition("#")
+        prefix, separator, title = entry["title"].rpartition(BREADCRUMB_SEPARATOR)
+        self.columns["objectID"].append(self.object_ids.add(entry["objectID"]))
+        self.columns["document"].append(self.documents.add(document))
+        self.columns["anchor"].append(anchor)
+        self.columns["prefix"].append(self.prefixes.add(prefix) if separator else -1)
+        self.columns["title"].append(title)
+        self.columns["text"].append(entry["text"])
+        if "match" in entry:
+            self.columns.setdefault("match", []).append(entry["match"])
+        # Entries collapsed by ``dedup`` are in the same document as the kept entry
+        anchors = [href.partition("#")[2] for href in entry.get("anchors", [])]
+        if anchors and "anchors" not in self.columns:
+            self.columns["anchors"] = [[] for _ in self.columns["text"][:-1]]
+        if "anchors" in self.columns:
+            self.columns["anchors"].append(anchors)
+
+    def encode(self) -> dict:
+        """
+        Get the compact index of the entries added so far.
+
+        Returns
+        -------
+        dict
+            Compact search index. The ``objectID``, the document part of ``href``
+            and the breadcrumb prefix of ``title`` are stored once in string tables,
+            and each entry references them by position in the ``columns``.
+
+        Notes
+        -----
+        An entry is rebuilt by ``decodeSearchIndex`` in ``search-utils.js``:
+
+        - ``objectID`` is ``objectIDs[columns.objectID[i]]``.
+        - ``href`` is ``documents[columns.document[i]]``, followed by ``#`` and
+          ``columns.anchor[i]``.
+        - ``title`` is ``prefixes[columns.prefix[i]]``, followed by `` > `` and
+          ``columns.title[i]``. The prefix is ``-1`` when the title has no breadcrumbs.
+        - ``text`` is ``columns.text[i]``.
+        - ``match``, when the entries are normalized, is ``columns.match[i]``.
+        - ``anchors``, when entries are collapsed by ``dedup``, are the anchors of
+          ``columns.anchors[i]``, each one in the document of ``href``.
+        """
+        return {
+            "format": "compact",
+            "version": COMPACT_FORMAT_VERSION,
+            "objectIDs": self.object_ids.strings,
+            "documents": self.documents.strings,
+            "prefixes": self.prefixes.strings,
+            "columns": self.columns,
+        }
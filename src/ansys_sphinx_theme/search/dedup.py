@@ -0,0 +1,98 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for collapsing the search index entries of a document with the same text."""
+
+import bisect
+import hashlib
+
+# Entries are near-identical when the shorter text, contained in the longer one,
+# has at least this fraction of its length. Set by the ``dedup_ratio`` option.
+DEDUP_CONTAINMENT_RATIO = 0.9
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a text before comparing it with the text of other entries.
+
+    Parameters
+    ----------
+    text : str
+        Text to normalize.
+
+    Returns
+    -------
+    str
+        Lowercase text with consecutive whitespace collapsed.
+    """
+    return " ".join(text.split()).lower()
+
+
+def deduplicate_entries(entries: list[dict], ratio: float = DEDUP_CONTAINMENT_RATIO) -> list[dict]:
+    """
+    Collapse the entries of a document with identical or near-identical text.
+
+    Parameters
+    ----------
+    entries : list[dict]
+        Search index entries of a document, in document order.
+    ratio : float, default: 0.9
+        Minimum ratio between the lengths of two texts, one containing the other,
+        for the entries to be collapsed.
+
+    Returns
+    -------
+    list[dict]
+        Entries that are kept. When entries are collapsed, the first one is kept and
+        the ``href`` of the others are listed in its ``anchors``.
+
+    Notes
+    -----
+    With the default ``ratio``, a section is rarely collapsed with one of the
+    API objects it documents, since the text of a single object seldom makes up
+    90% of the text of the section. A lower ``ratio`` collapses these entries too.
+
+    Identical texts are found by their hash. A text contained in another one is only
+    looked for in the kept entries whose length is within ``ratio``, so documents
+    with many entries of different sizes are not compared pairwise.
+    """
+    kept = []
+    kept_texts = []
+    hashes = {}
+    # Lengths of the kept texts, sorted, and the position of the matching entry
+    lengths = []
+    for entry in entries:
+        text = normalize_text(entry["text"])
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        position = hashes.get(digest)
+
+        if position is None:
+            start = bisect.bisect_left(lengths, (len(text) * ratio, -1))
+            end = bisect.bisect_right(lengths, (len(text) / ratio, len(kept)))
+            for _, candidate in lengths[start:end]:
+                candidate_text = kept_texts[candidate]
+                if text in candidate_text or candidate_text in text:
+                    position = candidate
+                    break
+
+        if position is None:
+            hashes[digest] = len(kept)
+            bisect.insort(lengths, (len(text), len(kept)))
+            kept.append(entry)
+            kept_texts.append(text)
+        else:
+            kept[position].setdefault("anchors", []).append(entry["href"])
+    return kept
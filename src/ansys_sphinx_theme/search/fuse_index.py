@@ -0,0 +1,148 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for generating the index created by ``Fuse.createIndex`` at build time."""
+
+import math
+import re
+
+# Tokens as defined by ``Fuse.js`` to compute the field-length norm
+FUSE_TOKEN_PATTERN = re.compile(r"[^ ]+")
+# Blank values, made of the characters removed by ``String.prototype.trim``
+FUSE_BLANK_PATTERN = re.compile(
+    r"[\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]*"
+)
+
+
+def fuse_key(key):
+    """Convert a key of the ``Fuse.js`` options as done by ``createKey`` in ``Fuse.js``."""
+    name = key["name"] if isinstance(key, dict) else key
+    path = name if isinstance(name, list) else name.split(".")
+    return {
+        "path": path,
+        "id": ".".join(path),
+        "weight": key.get("weight", 1) if isinstance(key, dict) else 1,
+        "src": name,
+        "getFn": None,
+    }
+
+
+def fuse_field_norm(value):
+    """Compute the field-length norm of a value as done by ``Fuse.js``."""
+    tokens_count = len(FUSE_TOKEN_PATTERN.findall(value))
+    norm = 1 / math.sqrt(tokens_count)
+    # Fuse.js rounds half up to three decimals
+    return math.floor(norm * 1000 + 0.5) / 1000
+
+
+def fuse_string(value):
+    """Convert a number or a boolean to a string as done by ``toString`` in ``Fuse.js``."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return value if isinstance(value, str) else repr(value)
+
+
+def fuse_get(entry, path):
+    """
+    Get the value of a key of an entry as done by ``get`` in ``Fuse.js``.
+
+    Parameters
+    ----------
+    entry : dict
+        Search index entry.
+    path : list[str]
+        Path of the key.
+
+    Returns
+    -------
+    Any
+        Value of the key, or ``None`` if it is missing. The values found through lists
+        are returned as a list. Strings, numbers and booleans at the end of the path
+        are converted to strings.
+    """
+    values = []
+    found_list = False
+
+    def deep_get(value, index):
+        nonlocal found_list
+        if value is None:
+            return
+        if index == len(path):
+            values.append(value)
+            return
+        child = value.get(path[index]) if isinstance(value, dict) else None
+        if child is None:
+            return
+        if index == len(path) - 1 and isinstance(child, str | int | float):
+            values.append(fuse_string(child))
+        elif isinstance(child, list):
+            found_list = True
+            for item in child:
+                deep_get(item, index + 1)
+        else:
+            deep_get(child, index + 1)
+
+    deep_get(entry, 0)
+    if found_list:
+        return values
+    return values[0] if values else None
+
+
+def _is_blank(value):
+    """Check whether a string is blank, as done by ``isBlank`` in ``Fuse.js``."""
+    return FUSE_BLANK_PATTERN.fullmatch(value) is not None
+
+
+def fuse_record(entry, position, fuse_keys):
+    """
+    Build the record of a search index entry in the ``Fuse.js`` index.
+
+    Parameters
+    ----------
+    entry : dict
+        Search index entry.
+    position : int
+        Position of the entry in the search index.
+    fuse_keys : list[dict]
+        Keys converted with ``fuse_key``.
+
+    Returns
+    -------
+    dict
+        Record of the entry, as built by ``FuseIndex._addObject`` in ``Fuse.js``.
+    """
+    record = {}
+    for key_position, key in enumerate(fuse_keys):
+        value = fuse_get(entry, key["path"])
+        if isinstance(value, list):
+            # Fuse.js walks the nested lists with a stack, so items are in reverse order
+            sub_records = []
+            stack = [(-1, value)]
+            while stack:
+                nested_position, item = stack.pop()
+                if isinstance(item, str) and not _is_blank(item):
+                    sub_records.append(
+                        {"v": item, "i": nested_position, "n": fuse_field_norm(item)}
+                    )
+                elif isinstance(item, list):
+                    stack.extend(enumerate(item))
+            record[str(key_position)] = sub_records
+        # Fuse.js only indexes strings that are not blank
+        elif isinstance(value, str) and not _is_blank(value):
+            record[str(key_position)] = {"v": value, "n": fuse_field_norm(value)}
+    return {"i": position, "$": record}
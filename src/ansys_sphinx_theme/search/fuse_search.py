@@ -16,21 +16,69 @@
 
 """Module for generating search indices."""
 
-import json
+from importlib import import_module
 from pathlib import Path
+import posixpath
 import re
+import tempfile
+import unicodedata
 
 from docutils import nodes
 from docutils.nodes import Element
+from sphinx import addnodes
+from sphinx.search import SearchEnglish, languages
 from sphinx.util import logging
+from sphinx.util.matching import Matcher
+from sphinx.util.parallel import ParallelTasks, make_chunks, parallel_available
+
+from ansys_sphinx_theme.search.bm25 import tokenize
+from ansys_sphinx_theme.search.cache import SearchIndexCache
+from ansys_sphinx_theme.search.dedup import DEDUP_CONTAINMENT_RATIO, deduplicate_entries
+from ansys_sphinx_theme.search.report import (
+    SEARCH_REPORT_FILE,
+    SearchIndexReport,
+    check_search_index_size,
+)
+from ansys_sphinx_theme.search.symbols import get_symbol
+from ansys_sphinx_theme.search.writers import (
+    SEARCH_INDEX_DIR,
+    SEARCH_MANIFEST_VERSION,
+    BM25IndexWriter,
+    CompactIndexWriter,
+    FullTextWriter,
+    FuseIndexWriter,
+    NDJSONSearchIndexWriter,
+    SearchIndexWriter,
+    ShardsWriter,
+    SymbolIndexWriter,
+    TitleIndexWriter,
+    TrigramIndexWriter,
+    get_manifest_files,
+    write_search_manifest,
+)
 
 logger = logging.getLogger(__name__)
 
+# Length of the text kept for display when the entries are normalized
+NORMALIZED_SNIPPET_LENGTH = 300
+# Forking is only worth it when there are more documents to index than this number
+PARALLEL_MIN_DOCUMENTS = 5
+
+# Node types whose text is not indexed by default
+UNWANTED_NODE_TYPES = (
+    nodes.math,
+    nodes.raw,
+    nodes.image,
+    nodes.figure,
+    nodes.comment,
+    nodes.literal_block,
+)
+
 
 class SearchIndex:
     """Generate a search index for a Sphinx document."""
 
-    def __init__(self, doc_name, app, filter_options=None):
+    def __init__(self, doc_name, app, filter_options=None, filter_matcher=None, doctree=None):
         """
         Initialize the search index object.
 
@@ -40,13 +88,21 @@ class SearchIndex:
             Name of the document.
         app : Sphinx
             Sphinx application instance.
+        filter_options : dict, optional
+            Search filters used to compute the ``objectID`` of the entries.
+        filter_matcher : SearchFilterMatcher, optional
+            Compiled search filters, shared between documents. When given,
+            ``filter_options`` is ignored.
+        doctree : docutils.nodes.document, optional
+            Doctree of the document. By default, the doctree is loaded from the
+            doctree directory.
         """
         self.doc_name = doc_name
         self.doc_path = f"{self.doc_name}.html"
         self.env = app.env
         self.theme_options = app.config.html_theme_options.get("static_search", {})
         self.doc_title = self.env.titles[self.doc_name].astext()
-        self.doc_tree = self.env.get_doctree(self.doc_name)
+        self.doc_tree = doctree if doctree is not None else self.env.get_doctree(self.doc_name)
         first_part = self.doc_name.split("/")[0]
         try:
             self.parent_title = (
@@ -55,75 +111,114 @@ class SearchIndex:
         except:  # noqa: E722
             self.parent_title = "Home"
         self.sections = []
+        self.symbols = []
         self.filter_options = filter_options
+        if filter_matcher is None:
+            filter_matcher = SearchFilterMatcher(filter_options or {})
+        # Breadcrumbs and objectID are the same for every section of the document
+        self.object_id = filter_matcher.match(self.doc_name) or self.parent_title
+        self.breadcrumbs = " > ".join(
+            self.env.titles[part].astext()
+            for part in self.doc_name.split("/")[:-1]
+            if part in self.env.titles
+        )
+        self.unwanted_types = get_unwanted_node_types(self.theme_options)
+        self.max_text_length = self.theme_options.get("max_text_length")
+        self.full_text = self.theme_options.get("full_text", False)
+        self.dedup = self.theme_options.get("dedup", False)
+        self.dedup_ratio = self.theme_options.get("dedup_ratio", DEDUP_CONTAINMENT_RATIO)
+        self.symbol_index = self.theme_options.get("symbol_index", False)
+        self.title_index = self.theme_options.get("title_index", False)
+        self.normalizer = None
+        if self.theme_options.get("normalize", False):
+            self.normalizer = get_text_normalizer(app)
+            # The text is only displayed, so a snippet is enough
+            if self.max_text_length is None:
+                self.max_text_length = NORMALIZED_SNIPPET_LENGTH
 
     def build_sections(self):
         """Build sections from the document tree.
 
-        Nodes indexed include titles, subsections, descriptions, and anchors.
+        Nodes indexed include titles, subsections, descriptions, and anchors. The
+        API symbols described in the document are collected at the same time. The
+        document tree is walked once and is not modified.
         """
-        for node in self.doc_tree.traverse(nodes.section):
-            subsections = list(node.traverse(nodes.section))
+        section_groups = []
+        self._collect_text(self.doc_tree, section_groups, None)
+        for section_group in section_groups:
+            self.sections.extend(section_group)
 
-            if len(subsections) > 1:
-                # get only the first section
-                main_section = subsections[0]
-                # remove subsections from the main section
-                for subsection in main_section.traverse(nodes.section):
-                    subsection.parent.remove(subsection)
-                node = main_section
+    def _collect_text(self, node, section_groups, section_group):
+        """
+        Get the indexed text of a node and add the entries of the nodes it contains.
 
-            section_title = node[0].astext()
+        Parameters
+        ----------
+        node : docutils.nodes.Node
+            Node to walk.
+        section_groups : list[list[dict]]
+            Entries of each section, in document order. Each group starts with the
+            entry of the section, followed by the entries of its ``desc`` elements.
+        section_group : list[dict] or None
+            Entries of the section containing the node, if any.
 
-            # Remove unwanted node types
-            unwanted_types = (
-                nodes.math,
-                nodes.raw,
-                nodes.image,
-                nodes.figure,
-                nodes.comment,
-                nodes.literal_block,
-            )
-            unwanted_nodes = [n for n in node.traverse() if isinstance(n, unwanted_types)]
-            [n.parent.remove(n) for n in unwanted_nodes if n.parent]
-
-            clean_text = node.astext()
-            section_anchor_id = _title_to_anchor(section_title)
-
-            # Add the main section
-            self.sections.append(
-                {
-                    "title": section_title,
-                    "text": clean_text,
-                    "anchor_id": section_anchor_id,
+        Returns
+        -------
+        str
+            Text of the node as given by ``astext``, without the text of its
+            subsections and of the unwanted node types.
+        """
+        if isinstance(node, nodes.Text) or type(node).astext is not Element.astext:
+            return node.astext()
+        # Resolved doctrees contain the table of contents of the child pages
+        if isinstance(node, nodes.compound) and "toctree-wrapper" in node["classes"]:
+            return ""
+
+        entry = None
+        if isinstance(node, nodes.section):
+            section_title = node[0].astext()
+            entry = {
+                "title": section_title,
+                "text": "",
+                "anchor_id": _title_to_anchor(section_title),
+                "kind": "section",
+            }
+            section_group = [entry]
+            section_groups.append(section_group)
+        elif section_group is not None and node.tagname == "desc":
+            anchor_id = node.attributes.get("ids", [])
+            signature = None
+            for child in node.children:
+                if child.tagname == "desc_signature" and child.attributes.get("ids"):
+                    anchor_id = child.attributes["ids"]
+                    signature = child
+
+            if anchor_id:
+                anchor_id = anchor_id[0]
+                entry = {
+                    "title": f"{section_group[0]['title']} > {anchor_id.split('.')[-1]}",
+                    "text": "",
+                    "anchor_id": anchor_id,
+                    "kind": "desc",
                 }
-            )
-
-            # Process `desc` elements (anchors) inside the section
-            for element in node.traverse(Element):
-                if element.tagname != "desc":
-                    continue
-
-                anchor_id = element.attributes.get("ids", [])
-                if element.children:
-                    for child in element.children:
-                        if child.tagname == "desc_signature" and child.attributes.get("ids"):
-                            anchor_id = child.attributes["ids"]
-
-                if isinstance(anchor_id, list) and anchor_id:
-                    anchor_id = anchor_id[0]
-                else:
-                    anchor_id = None
-
-                if anchor_id:
-                    anchor_title = f"{section_title} > {anchor_id.split('.')[-1]}"
-                    self.sections.append(
-                        {
-                            "title": anchor_title,
-                            "text": element.astext(),
-                            "anchor_id": anchor_id,
-                        }
-                    )
+                if self.symbol_index and signature is not None:
+                    symbol = get_symbol(node, signature, anchor_id)
+                    self.symbols.append({"href": f"{self.doc_path}#{anchor_id}", **symbol})
+                section_group.append(entry)
+
+        texts = []
+        for child in node.children:
+            if isinstance(child, self.unwanted_types):
+                continue
+            child_text = self._collect_text(child, section_groups, section_group)
+            # Subsections have their own entries
+            if not isinstance(child, nodes.section):
+                texts.append(child_text)
+        text = node.child_text_separator.join(texts)
+
+        if entry is not None:
+            entry["text"] = text
+        return text
 
     def generate_breadcrumbs(self, section_title: str) -> str:
         """
@@ -145,14 +240,7 @@ class SearchIndex:
         which is not needed for the breadcrumb trail. The breadcrumb trail is generated
         by iterating over the parts of `doc_name` and fetching the title from the environment.
         """
-        docs_parts = self.doc_name.split("/")[:-1]
-
-        breadcrumb_parts = [
-            self.env.titles[part].astext() for part in docs_parts if part in self.env.titles
-        ]
-
-        # Create breadcrumb hierarchy
-        breadcrumbs = " > ".join(breadcrumb_parts)
+        breadcrumbs = self.breadcrumbs
         ignore_doc_title = section_title == self.doc_title
 
         # Construct final breadcrumb path
@@ -167,18 +255,182 @@ class SearchIndex:
 
     @property
     def indices(self):
-        """Generate indices for each section."""
+        """Generate indices for each section, followed by the API symbols, if any."""
+        entries = []
         for section in self.sections:
             breadcrumbs = self.generate_breadcrumbs(section["title"])
-            self.object_id = filter_search_documents(
-                self.filter_options, self.doc_name, self.parent_title
-            )
-            yield {
+            entry = {
                 "objectID": self.object_id,
                 "href": f"{self.doc_path}#{section['anchor_id']}",
                 "title": breadcrumbs,
                 "text": section["text"],
             }
+            # Moved to the title index by ``create_search_index``
+            if self.title_index and section["kind"] == "section":
+                entry["sectionTitle"] = section["title"]
+            entries.append((entry, section["kind"]))
+
+        # Duplicates are found on the complete texts, before they are truncated
+        if self.dedup:
+            kept = {
+                id(entry)
+                for entry in deduplicate_entries([entry for entry, _ in entries], self.dedup_ratio)
+            }
+            entries = [(entry, kind) for entry, kind in entries if id(entry) in kept]
+
+        for entry, kind in entries:
+            text = entry["text"]
+            if self.normalizer is not None:
+                entry["match"] = self.normalizer.normalize(text)
+            max_length = self.max_text_length
+            if isinstance(max_length, dict):
+                max_length = max_length.get(kind)
+            if max_length and len(text) > max_length:
+                entry["text"] = text[:max_length].rstrip()
+                # The complete text is moved to a separate file by ``create_search_index``
+                if self.full_text:
+                    entry["fullText"] = text
+            yield entry
+
+        # API symbols follow the entries, so that removing a duplicate entry keeps
+        # its symbol. They are moved to the symbol index by ``create_search_index``.
+        for symbol in self.symbols:
+            yield {"symbol": symbol}
+
+
+def fold_diacritics(text):
+    """Remove the diacritics of a text, as done by ``foldDiacritics`` in ``search-utils.js``."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        character for character in decomposed if not unicodedata.category(character).startswith("M")
+    )
+
+
+class TextNormalizer:
+    """Normalize a text into the terms matched by the search.
+
+    Terms are folded to lowercase, stopwords are removed, and the remaining terms
+    are stemmed and stripped of their diacritics. ``normalizeQuery`` in
+    ``search-utils.js`` applies the same steps to the queries, using the stopwords
+    and the stemmer that Sphinx writes in ``language_data.js``.
+    """
+
+    def __init__(self, language):
+        """
+        Initialize the normalizer.
+
+        Parameters
+        ----------
+        language : sphinx.search.SearchLanguage
+            Search language providing the stopwords and the stemmer.
+        """
+        self.language = language
+        self.stems = {}
+
+    def normalize(self, text):
+        """
+        Normalize a text.
+
+        Parameters
+        ----------
+        text : str
+            Text to normalize.
+
+        Returns
+        -------
+        str
+            Normalized terms of the text, separated by spaces.
+        """
+        terms = []
+        for term in tokenize(text):
+            if term in self.language.stopwords:
+                continue
+            # Documents repeat the same words, so each word is only stemmed once
+            stem = self.stems.get(term)
+            if stem is None:
+                stem = self.stems[term] = fold_diacritics(self.language.stem(term))
+            terms.append(stem)
+        return " ".join(terms)
+
+
+def get_search_language(app):
+    """
+    Get the search language of the build, as used by the Sphinx search.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+
+    Returns
+    -------
+    sphinx.search.SearchLanguage
+        Search language of the HTML builder, or the one configured by
+        ``html_search_language`` if the builder has no search indexer.
+    """
+    indexer = getattr(app.builder, "indexer", None)
+    if indexer is not None:
+        return indexer.lang
+
+    language = app.config.html_search_language or app.config.language or "en"
+    language_class = languages.get(language) or languages.get(language.partition("_")[0])
+    if language_class is None:
+        return SearchEnglish(app.config.html_search_options)
+    if isinstance(language_class, str):
+        module_name, class_name = language_class.rsplit(".", 1)
+        language_class = getattr(import_module(module_name), class_name)
+    return language_class(app.config.html_search_options)
+
+
+def get_text_normalizer(app):
+    """
+    Get the text normalizer of the build, creating it if needed.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+
+    Returns
+    -------
+    TextNormalizer
+        Normalizer shared by every document.
+    """
+    if getattr(app, "_ast_text_normalizer", None) is None:
+        app._ast_text_normalizer = TextNormalizer(get_search_language(app))
+    return app._ast_text_normalizer
+
+
+def get_unwanted_node_types(static_search_options):
+    """
+    Get the node types whose text is not indexed.
+
+    Parameters
+    ----------
+    static_search_options : dict
+        Options of the ``static_search`` theme option. The ``exclude_node_types`` and
+        ``include_node_types`` keys are lists of names of ``docutils`` or Sphinx nodes
+        to add to or to remove from the default unwanted node types.
+
+    Returns
+    -------
+    tuple[type, ...]
+        Unwanted node types.
+    """
+    unwanted_types = dict.fromkeys(UNWANTED_NODE_TYPES)
+    for option, add in (("exclude_node_types", True), ("include_node_types", False)):
+        for node_name in static_search_options.get(option, []):
+            node_type = getattr(nodes, node_name, None) or getattr(addnodes, node_name, None)
+            if not isinstance(node_type, type) or not issubclass(node_type, nodes.Node):
+                logger.warning(
+                    f"Unknown node type '{node_name}' in '{option}' of 'static_search'", once=True
+                )
+                continue
+            if add:
+                unwanted_types[node_type] = None
+            else:
+                unwanted_types.pop(node_type, None)
+    return tuple(unwanted_types)
 
 
 def _title_to_anchor(title: str) -> str:
@@ -186,15 +438,418 @@ def _title_to_anchor(title: str) -> str:
     return re.sub(r"[^\w\s-]", "", title.lower().strip().replace(" ", "-"))
 
 
-def filter_search_documents(filters, doc_name, doc_title):
-    """Filter search documents based on the provided filters."""
-    if not filters:
-        return doc_title
-    for display_doc_name, doc_names in filters.items():
-        for value in doc_names:
-            if doc_name.startswith(value.rstrip("/")):
-                return display_doc_name
-    return doc_title
+class SearchFilterMatcher:
+    """Find the search filter of a document from the prefixes of its name.
+
+    The prefixes of all the filters are compiled into a character trie, so that a
+    document name is matched in a single walk whatever the number of filters.
+    """
+
+    def __init__(self, filters):
+        """
+        Compile the search filters.
+
+        Parameters
+        ----------
+        filters : dict[str, list[str]]
+            Prefixes of the names of the documents of each filter, as given in the
+            ``search_filters`` theme option.
+        """
+        self.names = list(filters)
+        self.trie = {}
+        for position, doc_names in enumerate(filters.values()):
+            for value in doc_names:
+                node = self.trie
+                for character in value.rstrip("/"):
+                    node = node.setdefault(character, {})
+                # The ``None`` key holds the position of the first filter ending here
+                node.setdefault(None, position)
+
+    def match(self, doc_name):
+        """
+        Get the search filter of a document.
+
+        Parameters
+        ----------
+        doc_name : str
+            Name of the document.
+
+        Returns
+        -------
+        str or None
+            Name of the first filter with a prefix of ``doc_name``, or ``None``.
+        """
+        node = self.trie
+        position = node.get(None)
+        for character in doc_name:
+            node = node.get(character)
+            if node is None:
+                break
+            node_position = node.get(None)
+            if node_position is not None and (position is None or node_position < position):
+                position = node_position
+        return None if position is None else self.names[position]
+
+
+class SearchExclusionMatcher:
+    """Find the documents excluded from the search index.
+
+    The rules of ``files_to_exclude`` are compiled once and matched against the
+    names of the documents, without accessing the file system.
+    """
+
+    def __init__(self, rules, srcdir, metadata=None):
+        """
+        Compile the exclusion rules.
+
+        Parameters
+        ----------
+        rules : list[str]
+            Documents or directories to exclude, relative to the source directory, or
+            glob patterns such as ``"examples/**/index"``.
+        srcdir : str or pathlib.Path
+            Source directory of the documentation, used to convert absolute paths.
+        metadata : dict[str, dict], optional
+            File-wide metadata of each document. Documents with the ``nosearch``
+            metadata are excluded.
+        """
+        self.metadata = metadata or {}
+        # The source directory itself, given as ``"."`` or ``""``, excludes everything
+        self.exclude_all = False
+        prefixes = []
+        patterns = []
+        for rule in rules:
+            rule = str(rule)
+            if Path(rule).is_absolute():
+                try:
+                    rule = Path(rule).relative_to(srcdir).as_posix()
+                except ValueError:
+                    logger.warning(f"Ignoring '{rule}' in 'files_to_exclude': not in {srcdir}")
+                    continue
+            rule = posixpath.normpath(rule.replace("\\", "/"))
+            if any(character in rule for character in "*?["):
+                patterns.append(rule)
+            elif rule == ".":
+                self.exclude_all = True
+            else:
+                prefixes.append(re.escape(rule))
+        # A document is excluded by its own name or by the name of a parent directory
+        self.prefix_pattern = re.compile(f"(?:{'|'.join(prefixes)})(?:/|$)") if prefixes else None
+        self.glob_matcher = Matcher(patterns) if patterns else None
+
+    def match(self, doc_name):
+        """
+        Check whether a document is excluded from the search index.
+
+        Parameters
+        ----------
+        doc_name : str
+            Name of the document.
+
+        Returns
+        -------
+        bool
+            Whether the document is excluded.
+        """
+        if self.exclude_all:
+            return True
+        if self.prefix_pattern is not None and self.prefix_pattern.match(doc_name):
+            return True
+        if self.glob_matcher is not None and self.glob_matcher(doc_name):
+            return True
+        return "nosearch" in self.metadata.get(doc_name, {})
+
+
+def iter_document_indices(app, docnames, filter_matcher=None):
+    """
+    Build the search index entries of each document, one document at a time.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    docnames : list[str]
+        Names of the documents to index.
+    filter_matcher : SearchFilterMatcher, optional
+        Compiled search filters used to compute the ``objectID`` of each entry.
+
+    Yields
+    ------
+    tuple[str, list[dict]]
+        Name of the document and its search index entries. The doctree of the
+        document is released before the next document is indexed.
+    """
+    for document in docnames:
+        search_index = SearchIndex(document, app, filter_matcher=filter_matcher)
+        search_index.build_sections()
+        entries = list(search_index.indices)
+        del search_index
+        yield document, entries
+
+
+def build_document_indices(app, docnames, filter_matcher=None):
+    """
+    Build the search index entries for a group of documents.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    docnames : list[str]
+        Names of the documents to index.
+    filter_matcher : SearchFilterMatcher, optional
+        Compiled search filters used to compute the ``objectID`` of each entry.
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Search index entries of each document.
+    """
+    return dict(iter_document_indices(app, docnames, filter_matcher))
+
+
+def get_search_index_processes(app, static_search_options):
+    """
+    Get the number of processes used to build the search index.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    static_search_options : dict
+        Options of the ``static_search`` theme option.
+
+    Returns
+    -------
+    int
+        Number of processes. A value of ``1`` means the index is built serially.
+
+    Notes
+    -----
+    By default, the number of processes follows the ``-j`` option of ``sphinx-build``.
+    The ``parallel`` key of ``static_search`` can disable the parallel build with
+    ``False`` or request a specific number of processes with an integer.
+    """
+    parallel = static_search_options.get("parallel", True)
+    if not parallel_available or parallel is False:
+        return 1
+    if parallel is True:
+        return max(app.parallel, 1)
+    return max(int(parallel), 1)
+
+
+def build_indices_in_parallel(app, docnames, filter_matcher, nproc, cache):
+    """
+    Build the search index entries by sharding the documents across processes.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    docnames : list[str]
+        Names of the documents to index.
+    filter_matcher : SearchFilterMatcher
+        Compiled search filters used to compute the ``objectID`` of each entry.
+    nproc : int
+        Number of processes to use.
+    cache : SearchIndexCache
+        Cache in which the entries are stored as soon as a worker returns them,
+        instead of being kept in memory.
+    """
+
+    def index_chunk(chunk):
+        return build_document_indices(app, chunk, filter_matcher)
+
+    def merge_chunk(chunk, chunk_indices):
+        for document, entries in chunk_indices.items():
+            cache.store(document, entries)
+
+    tasks = ParallelTasks(nproc)
+    for chunk in make_chunks(docnames, nproc):
+        tasks.add_task(index_chunk, chunk, merge_chunk)
+    tasks.join()
+
+
+def get_search_index_writers(static_dir, static_search_options, normalizer=None):
+    """
+    Get the writers of the search index files enabled by the options.
+
+    Parameters
+    ----------
+    static_dir : pathlib.Path
+        Path to the ``_static`` directory of the build.
+    static_search_options : dict
+        Options of the ``static_search`` theme option.
+    normalizer : TextNormalizer, optional
+        Normalizer of the entries, if they are normalized.
+
+    Returns
+    -------
+    list
+        Writers, the first one being the writer of ``search.json``.
+    """
+    writers = [SearchIndexWriter(static_dir)]
+    compact = static_search_options.get("format", "json") == "compact"
+    if compact:
+        writers.append(CompactIndexWriter(static_dir))
+    if static_search_options.get("ndjson", False):
+        writers.append(NDJSONSearchIndexWriter(static_dir))
+    fuse_keys = None
+    if static_search_options.get("prebuilt_index", False):
+        fuse_keys = static_search_options.get("keys", ["title", "text", "objectID"])
+    shards = static_search_options.get("shards", False)
+    if shards:
+        # Each shard is searched on its own, with its own index
+        writers.append(ShardsWriter(static_dir, _title_to_anchor, compact, fuse_keys))
+    elif fuse_keys is not None:
+        writers.append(FuseIndexWriter(static_dir, fuse_keys))
+    if static_search_options.get("engine", "fuse") == "bm25":
+        writers.append(BM25IndexWriter(static_dir, normalizer))
+    elif static_search_options.get("trigram_index", False) and not shards:
+        writers.append(TrigramIndexWriter(static_dir))
+    return writers
+
+
+def iter_search_index(app, docnames, outdated_docs, filter_matcher, nproc, cache):
+    """
+    Get the search index entries of each document, in the order of the documents.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    docnames : list[str]
+        Names of the documents included in the search index.
+    outdated_docs : list[str]
+        Documents to index, in the same order as ``docnames``. The entries of the
+        other documents are loaded from the cache.
+    filter_matcher : SearchFilterMatcher
+        Compiled search filters used to compute the ``objectID`` of each entry.
+    nproc : int
+        Number of processes used to index the outdated documents.
+    cache : SearchIndexCache
+        Cache in which the entries of the outdated documents are stored.
+
+    Yields
+    ------
+    tuple[str, list[dict]]
+        Name of the document and its search index entries.
+
+    Notes
+    -----
+    When the documents are indexed serially, a document is only indexed when its
+    entries are requested, so only one document is held in memory at a time.
+    """
+    parallel = nproc > 1 and len(outdated_docs) > PARALLEL_MIN_DOCUMENTS
+    if parallel:
+        logger.info(f"Building the search index in parallel using {nproc} processes")
+        build_indices_in_parallel(app, outdated_docs, filter_matcher, nproc, cache)
+    outdated_indices = iter_document_indices(app, [] if parallel else outdated_docs, filter_matcher)
+
+    outdated = set(outdated_docs)
+    for document in docnames:
+        if document in outdated and not parallel:
+            _, entries = next(outdated_indices)
+            cache.store(document, entries)
+        else:
+            # Up to date, or indexed in parallel and stored in the cache
+            entries = cache.load(document)
+        yield document, entries
+
+
+class SearchIndexCollector:
+    """Collect the search index entries of the documents while they are written.
+
+    The entries of a document are extracted from its resolved doctree, which is
+    already in memory during the write phase. Entries are stored in the cache until
+    ``create_search_index`` writes the search index files. When the cache is
+    disabled, they are stored in a temporary directory instead of being kept in
+    memory, which is removed once the search index is written.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize the collector.
+
+        Parameters
+        ----------
+        app : Sphinx
+            Sphinx application instance.
+        """
+        self.app = app
+        static_search_options = app.config.html_theme_options.get("static_search", {})
+        filter_options = app.config.html_theme_options.get("search_filters", {})
+        self.exclusion_matcher = SearchExclusionMatcher(
+            static_search_options.get("files_to_exclude", []), app.srcdir, app.env.metadata
+        )
+        self.filter_matcher = SearchFilterMatcher(filter_options)
+        self.spool_dir = None
+        cache_dir = None
+        if not static_search_options.get("cache", True):
+            self.spool_dir = tempfile.TemporaryDirectory(prefix="ast-search-")
+            cache_dir = self.spool_dir.name
+        self.cache = SearchIndexCache(app, static_search_options, filter_options, cache_dir)
+
+    def collect(self, docname, doctree):
+        """
+        Extract the search index entries of a document.
+
+        Parameters
+        ----------
+        docname : str
+            Name of the document.
+        doctree : docutils.nodes.document
+            Resolved doctree of the document.
+        """
+        if docname not in self.app.env.found_docs or self.exclusion_matcher.match(docname):
+            return
+        search_index = SearchIndex(
+            docname, self.app, filter_matcher=self.filter_matcher, doctree=doctree
+        )
+        search_index.build_sections()
+        self.cache.store(docname, list(search_index.indices))
+
+
+def get_search_index_collector(app):
+    """
+    Get the search index collector of the build, creating it if needed.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+
+    Returns
+    -------
+    SearchIndexCollector
+        Collector shared by the write phase and ``create_search_index``.
+    """
+    if getattr(app, "_ast_search_collector", None) is None:
+        app._ast_search_collector = SearchIndexCollector(app)
+    return app._ast_search_collector
+
+
+def collect_search_index(app, doctree, docname):
+    """
+    Extract the search index entries of a document once its doctree is resolved.
+
+    Parameters
+    ----------
+    app : Sphinx
+        Sphinx application instance.
+    doctree : docutils.nodes.document
+        Resolved doctree of the document.
+    docname : str
+        Name of the document.
+
+    Notes
+    -----
+    Sphinx resolves the doctrees in the main process, also when the pages are written
+    in parallel, so the entries are collected in the main process.
+    """
+    if app.builder.format != "html":
+        return
+    get_search_index_collector(app).collect(docname, doctree)
 
 
 def create_search_index(app, exception):
@@ -211,28 +866,88 @@ def create_search_index(app, exception):
     if exception:
         return
 
-    search_index_list = []
-
     static_search_options = app.config.html_theme_options.get("static_search", {})
-    excluded_docs = static_search_options.get("files_to_exclude", [])
-    included_docs = app.env.found_docs
-    filter_options = app.config.html_theme_options.get("search_filters", {})
-
-    for exclude_doc in excluded_docs:
-        exclude_doc = Path(exclude_doc).resolve()
-
-        # Exclude documents based on whether exclude_doc is a folder or a file:
-        # - For folders, exclude all documents within the folder.
-        # - For files, exclude only the exact file match.
-        included_docs = [
-            doc for doc in included_docs if not Path(doc).resolve().is_relative_to(exclude_doc)
-        ]
-
-    for document in included_docs:
-        search_index = SearchIndex(document, app, filter_options=filter_options)
-        search_index.build_sections()
-        search_index_list.extend(search_index.indices)
-
-    search_index_path = Path(app.builder.outdir) / "_static" / "search.json"
-    with search_index_path.open("w", encoding="utf-8") as index_file:
-        json.dump(search_index_list, index_file, ensure_ascii=False, separators=(",", ":"))
+    collector = get_search_index_collector(app)
+    included_docs = [
+        doc for doc in app.env.found_docs if not collector.exclusion_matcher.match(doc)
+    ]
+
+    # Sort the documents so that the index is identical between serial and parallel builds
+    included_docs = sorted(included_docs)
+
+    # Documents written during this build were indexed by ``collect_search_index``.
+    # Only the other documents that changed since the last build are indexed again.
+    cache = collector.cache
+    outdated_docs = cache.outdated(included_docs)
+    logger.info(
+        f"Updating the search index for {len(outdated_docs)} of {len(included_docs)} documents"
+    )
+
+    nproc = get_search_index_processes(app, static_search_options)
+    static_dir = Path(app.builder.outdir) / "_static"
+    normalizer = None
+    if static_search_options.get("normalize", False):
+        normalizer = get_text_normalizer(app)
+    writers = get_search_index_writers(static_dir, static_search_options, normalizer)
+    # Complete texts of the truncated entries, fetched by the search page when needed
+    full_text_writer = FullTextWriter(static_dir)
+    # API symbols, looked up by their name as they are typed in the search bar
+    symbol_writer = SymbolIndexWriter(static_dir)
+    # Section titles, completed as they are typed in the search bar
+    title_writer = TitleIndexWriter(static_dir)
+
+    # Entries are written as soon as a document is indexed, so that the memory used
+    # does not grow with the number of documents
+    documents = iter_search_index(
+        app,
+        included_docs,
+        outdated_docs,
+        collector.filter_matcher,
+        nproc,
+        cache,
+    )
+    report = SearchIndexReport() if static_search_options.get("report", False) else None
+    for document, entries in documents:
+        for entry in entries:
+            symbol = entry.get("symbol")
+            if symbol is not None:
+                symbol_writer.add(**symbol)
+                continue
+            full_text = entry.pop("fullText", None)
+            if full_text is not None:
+                full_text_writer.add(entry["href"], full_text)
+            section_title = entry.pop("sectionTitle", None)
+            if section_title is not None:
+                title_writer.add(entry["href"], section_title, entry["title"])
+            for writer in writers:
+                writer.add(entry)
+            if report is not None:
+                report.add(document, entry)
+
+    if collector.spool_dir is None:
+        cache.prune(included_docs)
+        cache.save()
+    else:
+        collector.spool_dir.cleanup()
+        # The next build of the application needs a new temporary directory
+        app._ast_search_collector = None
+
+    manifest = {}
+    for writer in [*writers, full_text_writer, symbol_writer, title_writer]:
+        manifest_value = writer.close()
+        if manifest_value is not None:
+            manifest[writer.manifest_key] = manifest_value
+    write_search_manifest(static_dir, {"version": SEARCH_MANIFEST_VERSION, **manifest})
+
+    index_size = (static_dir / "search.json").stat().st_size
+    if report is not None:
+        files = {"search.json": index_size}
+        for file_name in sorted(get_manifest_files(manifest)):
+            file_path = static_dir / SEARCH_INDEX_DIR / file_name
+            files[f"{SEARCH_INDEX_DIR}/{file_name}"] = file_path.stat().st_size
+        report.write(Path(app.builder.outdir) / SEARCH_REPORT_FILE, files)
+    check_search_index_size(
+        index_size,
+        static_search_options.get("max_index_size"),
+        static_search_options.get("max_index_size_action", "warning"),
+    )
@@ -0,0 +1,159 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for reporting the size of the search index files."""
+
+import heapq
+import json
+
+from sphinx.errors import ExtensionError
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+SEARCH_REPORT_FILE = "search-report.json"
+# Number of entries listed in the ``largest_entries`` of the report
+LARGEST_ENTRIES_COUNT = 20
+
+
+class SearchIndexReport:
+    """Collect the number of entries and bytes of the search index per document and objectID.
+
+    Sizes are the number of bytes of the entries in ``search.json``.
+    """
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.documents = {}
+        self.object_ids = {}
+        self.largest_entries = []
+        self.entries_count = 0
+
+    def add(self, document, entry):
+        """
+        Add a search index entry to the report.
+
+        Parameters
+        ----------
+        document : str
+            Name of the document of the entry.
+        entry : dict
+            Search index entry, as written in ``search.json``.
+        """
+        size = len(json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        for totals, key in ((self.documents, document), (self.object_ids, entry["objectID"])):
+            total = totals.setdefault(key, {"entries": 0, "bytes": 0})
+            total["entries"] += 1
+            total["bytes"] += size
+
+        # The counter keeps the heap from comparing entries of the same size
+        largest_entry = (size, self.entries_count, entry["href"], entry["title"])
+        if len(self.largest_entries) < LARGEST_ENTRIES_COUNT:
+            heapq.heappush(self.largest_entries, largest_entry)
+        else:
+            heapq.heappushpop(self.largest_entries, largest_entry)
+        self.entries_count += 1
+
+    def as_dict(self, files=None):
+        """
+        Get the content of the report.
+
+        Parameters
+        ----------
+        files : dict[str, int], optional
+            Size in bytes of each search index file.
+
+        Returns
+        -------
+        dict
+            Report, with the documents, objectIDs and entries sorted by decreasing size.
+        """
+
+        def by_size(totals, key_name):
+            return sorted(
+                ({key_name: key, **total} for key, total in totals.items()),
+                key=lambda total: total["bytes"],
+                reverse=True,
+            )
+
+        return {
+            "entries": self.entries_count,
+            "bytes": sum(total["bytes"] for total in self.documents.values()),
+            "files": files or {},
+            "documents": by_size(self.documents, "document"),
+            "objectIDs": by_size(self.object_ids, "objectID"),
+            "largest_entries": [
+                {"href": href, "title": title, "bytes": size}
+                for size, _, href, title in sorted(self.largest_entries, reverse=True)
+            ],
+        }
+
+    def write(self, path, files=None):
+        """
+        Write the report and log a summary.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path to the report file.
+        files : dict[str, int], optional
+            Size in bytes of each search index file.
+        """
+        report = self.as_dict(files)
+        with path.open("w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, ensure_ascii=False, indent=2)
+
+        logger.info(f"Search index: {report['entries']} entries, {report['bytes']} bytes")
+        for total in report["documents"][:5]:
+            logger.info(
+                f"  {total['document']}: {total['entries']} entries, {total['bytes']} bytes"
+            )
+        logger.info(f"Search index report written to {path}")
+
+
+def check_search_index_size(size, max_size, action="warning"):
+    """
+    Check the size of the search index against its budget.
+
+    Parameters
+    ----------
+    size : int
+        Size of ``search.json`` in bytes.
+    max_size : int or None
+        Maximum size of ``search.json`` in bytes. ``None`` disables the check.
+    action : str, default: "warning"
+        Whether to emit a ``"warning"`` or to fail the build with an ``"error"``
+        when the budget is exceeded.
+
+    Raises
+    ------
+    ExtensionError
+        If the budget is exceeded and ``action`` is ``"error"``.
+    ValueError
+        If ``action`` is neither ``"warning"`` nor ``"error"``.
+    """
+    # Invalid actions are reported even when the budget is met
+    if action not in ("warning", "error"):
+        raise ValueError(f"Invalid 'max_index_size_action': '{action}'. Use 'warning' or 'error'.")
+    if max_size is None or size <= max_size:
+        return
+    message = (
+        f"The search index is {size} bytes, which exceeds the budget of {max_size} bytes "
+        "set by 'max_index_size' in 'static_search'"
+    )
+    if action == "error":
+        raise ExtensionError(message)
+    logger.warning(message)
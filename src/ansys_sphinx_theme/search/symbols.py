@@ -0,0 +1,116 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for generating the index of the API symbols, looked up by their name."""
+
+from ansys_sphinx_theme.search.compact import StringTable
+
+
+def get_symbol(desc, signature, anchor_id):
+    """
+    Get the API symbol described by a ``desc`` node.
+
+    Parameters
+    ----------
+    desc : sphinx.addnodes.desc
+        Node describing the symbol.
+    signature : sphinx.addnodes.desc_signature
+        Signature of the symbol, whose anchor is ``anchor_id``.
+    anchor_id : str
+        Anchor of the symbol in its document.
+
+    Returns
+    -------
+    dict
+        ``name`` is the full name of the symbol within its ``module``, which is
+        empty outside of a module, and ``objtype`` is its object type, like
+        ``class`` or ``method``.
+    """
+    name = signature.get("fullname")
+    module = signature.get("module")
+    if not isinstance(name, str) or not name:
+        # Domains without full names, like the C++ domain, only have an anchor
+        name = anchor_id
+        module = None
+    return {"name": name, "module": module or "", "objtype": desc.get("objtype", "")}
+
+
+class SymbolIndexBuilder:
+    """Build the index of the API symbols one symbol at a time."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.types = StringTable()
+        self.modules = StringTable()
+        self.documents = StringTable()
+        self.symbols = []
+
+    def add(self, href: str, name: str, module: str, objtype: str):
+        """
+        Add an API symbol to the index.
+
+        Parameters
+        ----------
+        href : str
+            Link to the description of the symbol.
+        name : str
+            Full name of the symbol within its module.
+        module : str
+            Module of the symbol, or an empty string.
+        objtype : str
+            Object type of the symbol, like ``class`` or ``method``.
+        """
+        document, _, anchor = href.partition("#")
+        full_name = f"{module}.{name}" if module else name
+        self.symbols.append(
+            (
+                full_name,
+                [
+                    name,
+                    self.modules.add(module) if module else -1,
+                    self.types.add(objtype),
+                    self.documents.add(document),
+                    anchor,
+                ],
+            )
+        )
+
+    def build(self) -> dict:
+        """
+        Build the index of the symbols added so far.
+
+        Returns
+        -------
+        dict
+            Symbol index. ``symbols`` lists the name, the position of the module in
+            ``modules``, the position of the object type in ``types``, the position
+            of the document in ``documents`` and the anchor of each symbol. The
+            module is ``-1`` when the symbol has none. Symbols are sorted by full
+            name, including the module, regardless of case.
+
+        Notes
+        -----
+        ``SymbolIndex`` in ``search-utils.js`` looks the symbols up by a prefix of
+        their full name or of any dotted suffix of it, like ``Bar.me`` for
+        ``ansys.foo.Bar.method``.
+        """
+        symbols = sorted(self.symbols, key=lambda symbol: (symbol[0].lower(), symbol[0]))
+        return {
+            "types": self.types.strings,
+            "modules": self.modules.strings,
+            "documents": self.documents.strings,
+            "symbols": [symbol for _, symbol in symbols],
+        }
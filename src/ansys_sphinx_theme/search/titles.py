@@ -0,0 +1,99 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for generating the index completing the titles of the sections."""
+
+from ansys_sphinx_theme.search.compact import BREADCRUMB_SEPARATOR, StringTable
+
+
+def _utf16_length(text: str) -> int:
+    """Get the length of a text in UTF-16 code units, as measured in JavaScript."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+class TitleIndexBuilder:
+    """Build the index of the section titles one section at a time."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.documents = StringTable()
+        self.prefixes = StringTable()
+        self.titles = []
+
+    def add(self, href: str, title: str, breadcrumbs: str):
+        """
+        Add a section to the index.
+
+        Parameters
+        ----------
+        href : str
+            Link to the section.
+        title : str
+            Title of the section.
+        breadcrumbs : str
+            Title of the search index entry of the section, which ends with the
+            title of the section.
+        """
+        document, _, anchor = href.partition("#")
+        prefix = breadcrumbs[: -len(title)].removesuffix(BREADCRUMB_SEPARATOR)
+        self.titles.append(
+            (
+                title,
+                self.documents.add(document),
+                anchor,
+                self.prefixes.add(prefix) if prefix else -1,
+            )
+        )
+
+    def build(self) -> dict:
+        """
+        Build the index of the sections added so far.
+
+        Returns
+        -------
+        dict
+            Title index. ``titles`` lists the sections sorted by title regardless of
+            case. Each title is front-coded: it is stored as the number of characters
+            it shares with the previous title, followed by the rest of the title.
+            The position of the document in ``documents``, the anchor, and the
+            position of the breadcrumbs in ``prefixes`` follow, the breadcrumbs being
+            ``-1`` when the section has none.
+
+        Notes
+        -----
+        Sections sharing the same title, like the examples of each page, only
+        store their title once. The number of shared characters is counted in
+        UTF-16 code units, as ``TitleIndex`` in ``search-utils.js`` rebuilds the
+        titles with ``String.slice``.
+        """
+        titles = sorted(self.titles, key=lambda item: (item[0].lower(), item[0]))
+        previous = ""
+        index_titles = []
+        for title, document, anchor, prefix in titles:
+            shared = 0
+            for previous_character, character in zip(previous, title):
+                if previous_character != character:
+                    break
+                shared += 1
+            index_titles.append(
+                [_utf16_length(title[:shared]), title[shared:], document, anchor, prefix]
+            )
+            previous = title
+        return {
+            "documents": self.documents.strings,
+            "prefixes": self.prefixes.strings,
+            "titles": index_titles,
+        }
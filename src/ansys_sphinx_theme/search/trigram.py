@@ -0,0 +1,94 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for generating a trigram index selecting the entries worth a fuzzy search."""
+
+from ansys_sphinx_theme.search.bm25 import tokenize
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Get the trigrams of the terms of a text.
+
+    Each term is padded with a space on both sides, so that its first and last
+    characters weigh as much as the others.
+
+    Parameters
+    ----------
+    text : str
+        Text to split.
+
+    Returns
+    -------
+    set[str]
+        Trigrams of the text.
+
+    Notes
+    -----
+    Keep in sync with ``trigrams`` in ``search-utils.js``.
+    """
+    result = set()
+    for term in tokenize(text):
+        padded = f" {term} "
+        result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+class TrigramIndexBuilder:
+    """Build a trigram index of the search index entries one entry at a time."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.postings = {}
+        self.entries_count = 0
+
+    def add(self, entry: dict):
+        """
+        Add a search index entry to the index.
+
+        Parameters
+        ----------
+        entry : dict
+            Search index entry, as written in ``search.json``.
+        """
+        # Normalized entries are searched with normalized queries
+        text = f"{entry['title']} {entry.get('match', entry['text'])}"
+        for trigram in trigrams(text):
+            self.postings.setdefault(trigram, []).append(self.entries_count)
+        self.entries_count += 1
+
+    def build(self) -> dict:
+        """
+        Build the trigram index of the entries added so far.
+
+        Returns
+        -------
+        dict
+            Trigram index. ``trigrams`` is the sorted list of trigrams and
+            ``postings`` contains, for each trigram, the positions in
+            ``search.json`` of the entries containing it. Each position is stored
+            as the difference with the previous one, which keeps the numbers small.
+        """
+        trigrams_list = sorted(self.postings)
+        postings = []
+        for trigram in trigrams_list:
+            previous = 0
+            deltas = []
+            for position in self.postings[trigram]:
+                deltas.append(position - previous)
+                previous = position
+            postings.append(deltas)
+        return {"trigrams": trigrams_list, "postings": postings}
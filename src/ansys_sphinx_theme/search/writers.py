@@ -0,0 +1,542 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for writing the search index files one entry at a time.
+
+Each writer receives the search index entries in order through ``add`` and writes
+its file when it is closed. Writers of JSON files stream the entries to disk, so
+that the memory used does not grow with the number of entries.
+
+The files listed in the manifest are content-addressed: the hash of their content
+is part of their name, so clients can cache them for good and only fetch them
+again when the manifest points to a new name.
+"""
+
+from dataclasses import dataclass
+import hashlib
+import json
+import shutil
+
+from ansys_sphinx_theme.search.bm25 import BM25IndexBuilder
+from ansys_sphinx_theme.search.compact import CompactIndexEncoder
+from ansys_sphinx_theme.search.fuse_index import fuse_key, fuse_record
+from ansys_sphinx_theme.search.symbols import SymbolIndexBuilder
+from ansys_sphinx_theme.search.titles import TitleIndexBuilder
+from ansys_sphinx_theme.search.trigram import TrigramIndexBuilder
+
+# Directory of ``_static`` containing the search index shards and their manifest
+SEARCH_INDEX_DIR = "search-index"
+SEARCH_MANIFEST_FILE = "manifest.json"
+SEARCH_MANIFEST_VERSION = 1
+# Length of the content hash in the names of the files listed in the manifest
+CONTENT_HASH_LENGTH = 16
+# Suffixes of the siblings written by ``precompress_build_files``
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def _dumps(content):
+    """Serialize a value to compact JSON."""
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+
+
+class _JSONStreamWriter:
+    """Write a JSON value to a file one part at a time."""
+
+    def __init__(self, path, prefix, suffix, separator):
+        """
+        Open the file and write the beginning of the value.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path to the file.
+        prefix : str
+            Text written before the first part.
+        suffix : str
+            Text written after the last part.
+        separator : str
+            Text written between two parts.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.file = path.open("w", encoding="utf-8")
+        self.file.write(prefix)
+        self.suffix = suffix
+        self.separator = separator
+        self.count = 0
+
+    def _write_part(self, text):
+        """Write a serialized part of the value."""
+        if self.count:
+            self.file.write(self.separator)
+        self.file.write(text)
+        self.count += 1
+
+    def close(self):
+        """Write the end of the value and close the file."""
+        self.file.write(self.suffix)
+        self.file.close()
+
+
+class JSONArrayWriter(_JSONStreamWriter):
+    """Write the items of a JSON array to a file one at a time."""
+
+    def __init__(self, path, prefix="[", suffix="]"):
+        """
+        Open the file and write the beginning of the array.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path to the file.
+        prefix : str, default: "["
+            Text written before the first item.
+        suffix : str, default: "]"
+            Text written after the last item.
+        """
+        super().__init__(path, prefix, suffix, separator=",")
+
+    def write(self, item):
+        """Write an item of the array."""
+        self._write_part(_dumps(item))
+
+
+class JSONObjectWriter(_JSONStreamWriter):
+    """Write the members of a JSON object to a file one at a time."""
+
+    def __init__(self, path):
+        """Open the file and write the beginning of the object."""
+        super().__init__(path, prefix="{", suffix="}", separator=",")
+
+    def write(self, key, value):
+        """Write a member of the object."""
+        self._write_part(f"{_dumps(key)}:{_dumps(value)}")
+
+
+class NDJSONWriter(_JSONStreamWriter):
+    """Write the items of a newline-delimited JSON file one at a time."""
+
+    def __init__(self, path):
+        """Open the file."""
+        super().__init__(path, prefix="", suffix="", separator="")
+
+    def write(self, item):
+        """Write an item on its own line."""
+        self._write_part(f"{_dumps(item)}\n")
+
+
+def content_address(path):
+    """
+    Rename a file to include the hash of its content in its name.
+
+    ``search.compact.json`` is renamed to ``search.compact.<hash>.json``. When a file
+    with this name already exists, its content is the same, so it is kept as it is
+    along with its compressed siblings.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path to the file.
+
+    Returns
+    -------
+    str
+        New name of the file.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as content_file:
+        for chunk in iter(lambda: content_file.read(1 << 20), b""):
+            digest.update(chunk)
+    target = path.with_name(f"{path.stem}.{digest.hexdigest()[:CONTENT_HASH_LENGTH]}{path.suffix}")
+    if target.exists():
+        path.unlink()
+    else:
+        path.replace(target)
+    return target.name
+
+
+def write_search_file(static_dir, file_name, content):
+    """
+    Write a JSON file next to the search index manifest.
+
+    Parameters
+    ----------
+    static_dir : pathlib.Path
+        Path to the ``_static`` directory of the build.
+    file_name : str
+        Name of the file.
+    content : Any
+        JSON-serializable content of the file.
+
+    Returns
+    -------
+    str
+        Content-addressed path of the file relative to the manifest.
+    """
+    search_dir = static_dir / SEARCH_INDEX_DIR
+    search_dir.mkdir(parents=True, exist_ok=True)
+    with (search_dir / file_name).open("w", encoding="utf-8") as search_file:
+        json.dump(content, search_file, ensure_ascii=False, separators=(",", ":"))
+    return content_address(search_dir / file_name)
+
+
+class SearchIndexWriter:
+    """Write ``search.json``, the list of all the search index entries."""
+
+    manifest_key = "search"
+    file_name = "search.json"
+
+    def __init__(self, static_dir):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        static_dir : pathlib.Path
+            Path to the ``_static`` directory of the build.
+        """
+        self.static_dir = static_dir
+        self.writer = JSONArrayWriter(static_dir / self.file_name)
+
+    def add(self, entry):
+        """Add a search index entry."""
+        self.writer.write(entry)
+
+    def close(self):
+        """
+        Finish the file and get the path of its content-addressed copy.
+
+        ``_static/search.json`` keeps its name, since other projects load it as an
+        extra search source.
+        """
+        self.writer.close()
+        copy_path = self.static_dir / SEARCH_INDEX_DIR / self.file_name
+        copy_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.static_dir / self.file_name, copy_path)
+        return content_address(copy_path)
+
+
+class NDJSONSearchIndexWriter(SearchIndexWriter):
+    """Write the search index entries as newline-delimited JSON, one entry per line."""
+
+    manifest_key = "ndjson"
+    file_name = "search.ndjson"
+
+    def __init__(self, static_dir):
+        """Initialize the writer."""
+        self.writer = NDJSONWriter(static_dir / SEARCH_INDEX_DIR / self.file_name)
+
+    def close(self):
+        """Finish the file and get its path relative to the manifest."""
+        self.writer.close()
+        return content_address(self.writer.path)
+
+
+class FullTextWriter:
+    """Write the complete texts of the truncated entries, indexed by ``href``."""
+
+    manifest_key = "full_text"
+    file_name = "full-text.json"
+
+    def __init__(self, static_dir):
+        """Initialize the writer. The file is only created for the first text."""
+        self.path = static_dir / SEARCH_INDEX_DIR / self.file_name
+        self.writer = None
+
+    def add(self, href, text):
+        """Add the complete text of an entry."""
+        if self.writer is None:
+            self.writer = JSONObjectWriter(self.path)
+        self.writer.write(href, text)
+
+    def close(self):
+        """Finish the file and get its path relative to the manifest, if any."""
+        if self.writer is None:
+            return None
+        self.writer.close()
+        return content_address(self.path)
+
+
+class CompactIndexWriter:
+    """Write the search index entries in the compact columnar format."""
+
+    manifest_key = "compact"
+    file_name = "search.compact.json"
+
+    def __init__(self, static_dir):
+        """Initialize the writer."""
+        self.static_dir = static_dir
+        self.encoder = CompactIndexEncoder()
+
+    def add(self, entry):
+        """Add a search index entry."""
+        self.encoder.add(entry)
+
+    def close(self):
+        """Write the file and get its path relative to the manifest."""
+        return write_search_file(self.static_dir, self.file_name, self.encoder.encode())
+
+
+@dataclass
+class _Shard:
+    """Search index file of an ``objectID`` being written by ``ShardsWriter``."""
+
+    path: str
+    writer: CompactIndexEncoder | JSONArrayWriter
+    fuse_writer: "FuseIndexWriter | None"
+    entries: int = 0
+
+
+class ShardsWriter:
+    """Write one search index file for each ``objectID``."""
+
+    manifest_key = "shards"
+
+    def __init__(self, static_dir, slugify, compact=False, fuse_keys=None):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        static_dir : pathlib.Path
+            Path to the ``_static`` directory of the build.
+        slugify : Callable[[str], str]
+            Function converting an ``objectID`` into a part of a file name.
+        compact : bool, default: False
+            Whether to write the shards in the compact columnar format.
+        fuse_keys : list[str | dict], optional
+            Keys searched by ``Fuse.js``. When given, the index created by
+            ``Fuse.createIndex`` is also written for each shard.
+        """
+        self.static_dir = static_dir
+        self.slugify = slugify
+        self.compact = compact
+        self.fuse_keys = fuse_keys
+        self.shards = {}
+
+    def add(self, entry):
+        """Add a search index entry to the shard of its ``objectID``."""
+        object_id = entry["objectID"]
+        shard = self.shards.get(object_id)
+        if shard is None:
+            # The position keeps the file names unique when two objectIDs have the same slug
+            name = f"shard-{len(self.shards)}-{self.slugify(object_id)}"
+            path = f"{name}.json"
+            writer = (
+                CompactIndexEncoder()
+                if self.compact
+                else JSONArrayWriter(self.static_dir / SEARCH_INDEX_DIR / path)
+            )
+            fuse_writer = (
+                None
+                if self.fuse_keys is None
+                else FuseIndexWriter(self.static_dir, self.fuse_keys, f"{name}.fuse-index.json")
+            )
+            shard = self.shards[object_id] = _Shard(path, writer, fuse_writer)
+        if isinstance(shard.writer, CompactIndexEncoder):
+            shard.writer.add(entry)
+        else:
+            shard.writer.write(entry)
+        if shard.fuse_writer is not None:
+            shard.fuse_writer.add(entry)
+        shard.entries += 1
+
+    def close(self):
+        """
+        Finish the shards.
+
+        Returns
+        -------
+        list[dict]
+            Description of each shard, containing its ``objectID``, its path relative
+            to the manifest, its number of entries and, if any, the path of its
+            ``Fuse.js`` index.
+        """
+        shards = []
+        for object_id, shard in self.shards.items():
+            if isinstance(shard.writer, CompactIndexEncoder):
+                path = write_search_file(self.static_dir, shard.path, shard.writer.encode())
+            else:
+                shard.writer.close()
+                path = content_address(shard.writer.path)
+            description = {"objectID": object_id, "path": path, "entries": shard.entries}
+            if shard.fuse_writer is not None:
+                description["fuse_index"] = shard.fuse_writer.close()
+            shards.append(description)
+        return shards
+
+
+class FuseIndexWriter:
+    """Write the index created by ``Fuse.createIndex`` for the search index entries."""
+
+    manifest_key = "fuse_index"
+    file_name = "fuse-index.json"
+
+    def __init__(self, static_dir, keys, file_name=None):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        static_dir : pathlib.Path
+            Path to the ``_static`` directory of the build.
+        keys : list[str | dict]
+            Keys searched by ``Fuse.js``, as given in its options.
+        file_name : str, optional
+            Name of the file. The default is ``fuse-index.json``.
+        """
+        self.fuse_keys = [fuse_key(key) for key in keys]
+        self.writer = JSONArrayWriter(
+            static_dir / SEARCH_INDEX_DIR / (file_name or self.file_name),
+            prefix=f'{{"keys":{_dumps(self.fuse_keys)},"records":[',
+            suffix="]}",
+        )
+
+    def add(self, entry):
+        """Add the record of a search index entry."""
+        self.writer.write(fuse_record(entry, self.writer.count, self.fuse_keys))
+
+    def close(self):
+        """Finish the file and get its path relative to the manifest."""
+        self.writer.close()
+        return content_address(self.writer.path)
+
+
+class BM25IndexWriter:
+    """Write the inverted index with BM25 scores of the search index entries."""
+
+    manifest_key = "bm25"
+    file_name = "bm25.json"
+
+    def __init__(self, static_dir, normalizer=None):
+        """Initialize the writer."""
+        self.static_dir = static_dir
+        self.builder = BM25IndexBuilder(normalizer)
+
+    def add(self, entry):
+        """Add a search index entry."""
+        self.builder.add(entry)
+
+    def close(self):
+        """Write the file and get its path relative to the manifest."""
+        return write_search_file(self.static_dir, self.file_name, self.builder.build())
+
+
+class TrigramIndexWriter:
+    """Write the trigram index selecting the candidate entries of a query."""
+
+    manifest_key = "trigrams"
+    file_name = "trigrams.json"
+
+    def __init__(self, static_dir):
+        """Initialize the writer."""
+        self.static_dir = static_dir
+        self.builder = TrigramIndexBuilder()
+
+    def add(self, entry):
+        """Add a search index entry."""
+        self.builder.add(entry)
+
+    def close(self):
+        """Write the file and get its path relative to the manifest."""
+        return write_search_file(self.static_dir, self.file_name, self.builder.build())
+
+
+class SymbolIndexWriter:
+    """Write the index of the API symbols described in the documents."""
+
+    manifest_key = "symbols"
+    file_name = "symbols.json"
+
+    def __init__(self, static_dir):
+        """Initialize the writer. The file is only written if a symbol is added."""
+        self.static_dir = static_dir
+        self.builder = SymbolIndexBuilder()
+
+    def add(self, href, name, module, objtype):
+        """Add an API symbol."""
+        self.builder.add(href, name, module, objtype)
+
+    def close(self):
+        """Write the file and get its path relative to the manifest, if any."""
+        if not self.builder.symbols:
+            return None
+        return write_search_file(self.static_dir, self.file_name, self.builder.build())
+
+
+class TitleIndexWriter:
+    """Write the index completing the titles of the sections."""
+
+    manifest_key = "titles"
+    file_name = "titles.json"
+
+    def __init__(self, static_dir):
+        """Initialize the writer. The file is only written if a section is added."""
+        self.static_dir = static_dir
+        self.builder = TitleIndexBuilder()
+
+    def add(self, href, title, breadcrumbs):
+        """Add a section."""
+        self.builder.add(href, title, breadcrumbs)
+
+    def close(self):
+        """Write the file and get its path relative to the manifest, if any."""
+        if not self.builder.titles:
+            return None
+        return write_search_file(self.static_dir, self.file_name, self.builder.build())
+
+
+def write_search_manifest(static_dir, manifest):
+    """
+    Write the manifest describing the search index files.
+
+    Files listed in the manifest of a previous build that are not part of the
+    new manifest are removed, along with their compressed siblings.
+
+    Parameters
+    ----------
+    static_dir : pathlib.Path
+        Path to the ``_static`` directory of the build.
+    manifest : dict
+        Manifest to write. Paths are relative to the manifest file.
+    """
+    search_dir = static_dir / SEARCH_INDEX_DIR
+    manifest_path = search_dir / SEARCH_MANIFEST_FILE
+
+    if manifest_path.exists():
+        try:
+            previous_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            previous_manifest = {}
+        current_files = get_manifest_files(manifest)
+        for file_name in get_manifest_files(previous_manifest) - current_files:
+            for suffix in ("", *COMPRESSED_SUFFIXES):
+                (search_dir / f"{file_name}{suffix}").unlink(missing_ok=True)
+
+    search_dir.mkdir(parents=True, exist_ok=True)
+    with manifest_path.open("w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, separators=(",", ":"))
+
+
+def get_manifest_files(manifest):
+    """Get the paths of the files listed in a search index manifest."""
+    files = set()
+    for shard in manifest.get("shards", []):
+        files.add(shard["path"])
+        if "fuse_index" in shard:
+            files.add(shard["fuse_index"])
+    files.update(value for value in manifest.values() if isinstance(value, str))
+    return files
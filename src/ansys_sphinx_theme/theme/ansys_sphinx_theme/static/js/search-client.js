@@ -0,0 +1,133 @@
+/**
+ * @file search-client.js
+ * @description Module imported by `search.js` and `search-main.js` when the
+ * search is first needed, so that pages where nobody searches do not load the
+ * search index.
+ */
+
+/**
+ * Client of `search-worker.js`, which loads the search index and answers the
+ * queries outside of the main thread.
+ */
+export class SearchWorkerClient {
+  /**
+   * Start the worker and let it load the search index.
+   * @param {Object} config - Settings of the page.
+   * @param {boolean} config.preloadShards - Whether all the shards are loaded
+   *   at once, instead of on demand.
+   * @param {Object} config.libraries - Base URL of the extra sources to load.
+   * @param {Function} config.onLibraryLoaded - Called with the name of each
+   *   extra source and whether it could be loaded.
+   */
+  constructor({
+    preloadShards = false,
+    libraries = {},
+    onLibraryLoaded = () => {},
+  } = {}) {
+    this.onLibraryLoaded = onLibraryLoaded;
+    this.lastId = 0;
+    this.pending = new Map();
+    this.pendingSuggestions = new Map();
+    this.ready = new Promise((resolve, reject) => {
+      this.resolveReady = resolve;
+      this.rejectReady = reject;
+    });
+    this.worker = new Worker(SEARCH_WORKER);
+    this.worker.onmessage = ({ data }) => this.handleMessage(data);
+    this.worker.onerror = (event) =>
+      this.rejectReady(new Error(event.message));
+    const absoluteUrl = (url) => new URL(url, window.location.href).href;
+    this.worker.postMessage({
+      type: "init",
+      config: {
+        options: SEARCH_OPTIONS,
+        manifest: absoluteUrl(SEARCH_MANIFEST),
+        languageData: absoluteUrl(LANGUAGE_DATA),
+        preloadShards,
+        libraries,
+      },
+    });
+  }
+
+  /**
+   * Handle a message posted by the worker.
+   * @param {Object} data - Message described in `search-worker.js`.
+   */
+  handleMessage(data) {
+    switch (data.type) {
+      case "ready":
+        this.resolveReady(data);
+        break;
+      case "error":
+        this.rejectReady(new Error(data.message));
+        break;
+      case "library":
+        this.onLibraryLoaded(data.library, data.loaded);
+        break;
+      case "results":
+        this.pending.get(data.id)?.(data.results);
+        this.pending.delete(data.id);
+        break;
+      case "suggestions":
+        this.pendingSuggestions.get(data.id)?.({
+          symbols: data.symbols,
+          titles: data.titles,
+        });
+        this.pendingSuggestions.delete(data.id);
+        break;
+    }
+  }
+
+  /**
+   * Search a query, cancelling the queries that are still running.
+   * @param {string} query - Query typed by the user.
+   * @param {Object} options - Search options: `limit`, the `objectIDs` of the
+   *   documents to search, whether to search the `documents`, the names of the
+   *   `libraries` to search, and whether to replace the truncated texts by
+   *   their `fullText`.
+   * @returns {Promise<Array<Object>|null>} Promise resolving to the matching
+   *   entries, or to `null` when the query is cancelled.
+   */
+  search(query, options = {}) {
+    this.resolvePending();
+    const id = ++this.lastId;
+    return new Promise((resolve) => {
+      this.pending.set(id, resolve);
+      this.worker.postMessage({ type: "search", id, query, ...options });
+    });
+  }
+
+  /**
+   * Look up the API symbols whose name, or a dotted suffix of it, starts with a
+   * query, and the sections whose title starts with it. Lookups are not
+   * cancelled by the next queries, as they are immediate.
+   * @param {string} query - Beginning of a symbol name or of a title.
+   * @param {Object} options - Lookup options: `limit`, for each kind.
+   * @returns {Promise<Object>} Promise resolving to the `symbols`, with their
+   *   full `name`, `module`, `type` and `href`, and to the `titles`, with their `title`,
+   *   `breadcrumbs` and `href`. Both are empty without their index.
+   */
+  suggest(query, { limit = 10 } = {}) {
+    const id = ++this.lastId;
+    return new Promise((resolve) => {
+      this.pendingSuggestions.set(id, resolve);
+      this.worker.postMessage({ type: "suggest", id, query, limit });
+    });
+  }
+
+  /**
+   * Cancel the queries that are still running.
+   */
+  cancel() {
+    this.resolvePending();
+    this.worker.postMessage({ type: "cancel" });
+  }
+
+  /**
+   * Resolve the pending queries as cancelled.
+   */
+  resolvePending() {
+    this.pending.forEach((resolve) => resolve(null));
+    this.pending.clear();
+  }
+}
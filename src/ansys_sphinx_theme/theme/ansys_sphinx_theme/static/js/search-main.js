@@ -1,8 +1,8 @@
 /**
  * search-main.js
  *
- * Main search logic for the documentation site. Handles search index loading, filtering, and UI updates.
- * Uses Fuse.js for fuzzy searching and IndexedDB for caching search data.
+ * Main search logic for the documentation site. Handles filtering and UI updates.
+ * The search index is loaded and searched with Fuse.js by `search-worker.js`.
  *
  */
 
@@ -10,83 +10,14 @@
 const SEARCH_BAR = document.getElementById("search-bar");
 const SEARCH_INPUT = SEARCH_BAR.querySelector(".bd-search input.form-control");
 
-// Configure RequireJS for Fuse.js
-require.config({
-  paths: {
-    fuse: "https://cdn.jsdelivr.net/npm/fuse.js@6.6.2/dist/fuse.min",
-  },
-});
-
-/**
- * Open or create an IndexedDB database for caching search indexes.
- * @param {string} name - Name of the database.
- * @param {number} version - Version of the database.
- * @returns {Promise<IDBDatabase>} Promise resolving to the database instance.
- */
-function openDB(name = "search-cache", version = 1) {
-  return new Promise((resolve, reject) => {
-    const request = indexedDB.open(name, version);
-    request.onerror = () => {
-      console.error("IndexedDB open error:", request.error);
-      reject(request.error);
-    };
-    request.onsuccess = () => {
-      resolve(request.result);
-    };
-    request.onupgradeneeded = (event) => {
-      const db = event.target.result;
-      if (!db.objectStoreNames.contains("indexes")) {
-        db.createObjectStore("indexes");
-      }
-    };
-  });
-}
-
-/**
- * Retrieve a value from IndexedDB by key.
- * @param {string} key - The key to look up in the object store.
- * @returns {Promise<any>} Promise resolving to the retrieved value.
- */
-async function getFromIDB(key) {
-  const db = await openDB();
-  return new Promise((resolve, reject) => {
-    const transaction = db.transaction("indexes", "readonly");
-    const store = transaction.objectStore("indexes");
-    const request = store.get(key);
-    request.onsuccess = () => resolve(request.result);
-    request.onerror = () => reject(request.error);
-  });
-}
-
 /**
- * Save a key-value pair to IndexedDB.
- * @param {string} key - The key to store the value under.
- * @param {any} value - The value to store.
- * @returns {Promise<boolean>} Promise resolving when saving is complete.
+ * Main search logic, run once the page is loaded.
  */
-async function saveToIDB(key, value) {
-  const db = await openDB();
-  return new Promise((resolve, reject) => {
-    const transaction = db.transaction("indexes", "readwrite");
-    const store = transaction.objectStore("indexes");
-    const request = store.put(value, key);
-    request.onsuccess = () => resolve(true);
-    request.onerror = () => {
-      console.error("Failed to save to IndexedDB:", request.error);
-      reject(request.error);
-    };
-  });
-}
-
-/**
- * Main search logic, loaded after Fuse.js is available.
- */
-require(["fuse"], function (Fuse) {
-  let fuse;
-  let searchData = [];
+document.addEventListener("DOMContentLoaded", function () {
+  let searchWorker;
+  let objectIDs = [];
   let selectedObjectIDs = [];
   let selectedLibraries = [];
-  const libSearchData = {};
   let selectedFilter = new Set();
 
   /**
@@ -109,30 +40,13 @@ require(["fuse"], function (Fuse) {
    */
   async function initializeSearch() {
     try {
-      const cacheKey = "main-search-index";
-      let data = await getFromIDB(cacheKey);
-      if (!data) {
-        const response = await fetch(SEARCH_FILE);
-        data = await response.json();
-        await saveToIDB(cacheKey, data);
-      }
-      searchData = data;
-      fuse = new Fuse(searchData, SEARCH_OPTIONS);
-
-      // Load library search data
-      const allLibs = Object.keys(EXTRA_SOURCES);
-      for (const lib of allLibs) {
-        const cacheKey = `lib-search-${lib}`;
-        let libData = await getFromIDB(cacheKey);
-        if (!libData) {
-          const libPath = EXTRA_SOURCES[lib];
-          const url = `${libPath}/_static/search.json`;
-          const res = await fetch(url);
-          libData = await res.json();
-          await saveToIDB(cacheKey, libData);
-        }
-        libSearchData[lib] = libData;
-      }
+      const { SearchWorkerClient } = await import("./search-client.js");
+      // Shards are loaded on demand, depending on the selected filters
+      searchWorker = new SearchWorkerClient({
+        libraries: EXTRA_SOURCES,
+        onLibraryLoaded: handleLibraryLoaded,
+      });
+      ({ objectIDs } = await searchWorker.ready);
       setupFilterDropdown();
       showObjectIdDropdown();
       showLibraryDropdown();
@@ -141,6 +55,19 @@ require(["fuse"], function (Fuse) {
     }
   }
 
+  /**
+   * Search again when a selected library is loaded, so that its results are
+   * added to the results already shown.
+   * @param {string} library - Name of the library.
+   * @param {boolean} loaded - Whether the library could be loaded.
+   */
+  function handleLibraryLoaded(library, loaded) {
+    const query = document.getElementById("search-input").value.trim();
+    if (loaded && query && selectedLibraries.includes(library)) {
+      performSearch();
+    }
+  }
+
   /**
    * Sets up the filter dropdown and its toggle interactions in the sidebar.
    */
@@ -204,10 +131,7 @@ require(["fuse"], function (Fuse) {
   function showObjectIdDropdown() {
     const dropdown = document.getElementById("objectid-dropdown");
     dropdown.innerHTML = "";
-    const objectIDs = [
-      ...new Set(searchData.map((item) => item.objectID)),
-    ].filter(Boolean);
-    objectIDs.forEach((id) => {
+    objectIDs.filter(Boolean).forEach((id) => {
       const checkbox = createCheckboxItem(id, selectedObjectIDs, () => {
         renderSelectedChips();
         performSearch();
@@ -303,49 +227,21 @@ require(["fuse"], function (Fuse) {
    */
   async function performSearch() {
     const query = document.getElementById("search-input").value.trim();
-    if (!fuse) return;
+    if (!searchWorker) return;
     const resultsContainer = document.getElementById("search-results");
     resultsContainer.innerHTML = "Searching...";
-    let docResults = [];
-    let libResults = [];
-    const resultLimit = getSelectedResultLimit();
-    // Search in internal documents
-    if (selectedFilter.size === 0 || selectedFilter.has("Documents")) {
-      docResults = fuse
-        .search(query, { limit: resultLimit })
-        .map((r) => r.item);
-      if (selectedObjectIDs.length > 0) {
-        docResults = docResults.filter((item) =>
-          selectedObjectIDs.includes(item.objectID),
-        );
-      }
-    }
-    // Search in selected libraries
-    for (const lib of selectedLibraries) {
-      const libBaseUrl = EXTRA_SOURCES[lib];
-      const cacheKey = `lib-search-${lib}`;
-      try {
-        const data = await getFromIDB(cacheKey);
-        if (data) {
-          const enrichedEntries = data.map((entry) => ({
-            title: entry.title,
-            text: entry.text,
-            section: entry.section,
-            link: `${libBaseUrl}${entry.href}`,
-            source: lib,
-          }));
-          const libFuse = new Fuse(enrichedEntries, SEARCH_OPTIONS);
-          const results = libFuse
-            .search(query, { limit: resultLimit })
-            .map((r) => r.item);
-          libResults.push(...results);
-        }
-      } catch (err) {
-        console.error(`Error accessing cache for ${lib}:`, err);
-      }
-    }
-    // Merge and show results
-    const mergedResults = [...docResults, ...libResults];
+    const mergedResults = await searchWorker.search(query, {
+      limit: getSelectedResultLimit(),
+      objectIDs: selectedObjectIDs,
+      // Search in internal documents
+      documents: selectedFilter.size === 0 || selectedFilter.has("Documents"),
+      // Search in selected libraries
+      libraries: selectedLibraries,
+      // Show the complete texts of the truncated entries
+      fullText: true,
+    });
+    // A more recent search is running
+    if (!mergedResults) return;
     if (mergedResults.length === 0) {
       resultsContainer.innerHTML = "<p>No results found.</p>";
       return;
@@ -356,37 +252,44 @@ require(["fuse"], function (Fuse) {
 
   /**
    * Highlight search query in the results.
+   *
+   * Results are never dropped when their text does not contain the query
+   * literally, since they may match a normalized form of the query, a
+   * misspelling, or a part of the text cut from the preview.
    * @param {Array} results - Array of result objects.
    * @param {string} query - Search query.
    * @returns {Array} Highlighted results.
    */
   function highlightResults(results, query) {
-    const regex = new RegExp(`(${query})`, "gi");
-    return results
-      .map((result) => {
-        const matchIndex = result.text
-          .toLowerCase()
-          .indexOf(query.toLowerCase());
-        if (matchIndex === -1) return null;
-        const contextLength = 100;
-        const start = Math.max(0, matchIndex - contextLength);
-        const end = Math.min(result.text.length, matchIndex + contextLength);
-        let snippet = result.text.slice(start, end);
-        if (start > 0) snippet = "…" + snippet;
-        if (end < result.text.length) snippet += "…";
-        return {
-          ...result,
-          title: result.title.replace(
-            regex,
-            `<span class="search-highlight">$1</span>`,
-          ),
-          text: snippet.replace(
-            regex,
-            `<span class="search-highlight">$1</span>`,
-          ),
-        };
-      })
-      .filter(Boolean);
+    const escapedQuery = query.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+    const regex = new RegExp(`(${escapedQuery})`, "gi");
+    const contextLength = 100;
+    return results.map((result) => {
+      const matchIndex = result.text.toLowerCase().indexOf(query.toLowerCase());
+      // Without a literal match, the beginning of the text is shown
+      const start =
+        matchIndex === -1 ? 0 : Math.max(0, matchIndex - contextLength);
+      const end = Math.min(
+        result.text.length,
+        matchIndex === -1
+          ? 2 * contextLength
+          : matchIndex + query.length + contextLength,
+      );
+      let snippet = result.text.slice(start, end);
+      if (start > 0) snippet = "…" + snippet;
+      if (end < result.text.length) snippet += "…";
+      return {
+        ...result,
+        title: result.title.replace(
+          regex,
+          `<span class="search-highlight">$1</span>`,
+        ),
+        text: snippet.replace(
+          regex,
+          `<span class="search-highlight">$1</span>`,
+        ),
+      };
+    });
   }
 
   /**
@@ -411,6 +314,19 @@ require(["fuse"], function (Fuse) {
         text.className = "result-text";
         div.appendChild(text);
       }
+      // Sections with the same text, collapsed into this result by `dedup`
+      if (item.anchors?.length) {
+        const anchors = document.createElement("p");
+        anchors.className = "result-anchors";
+        item.anchors.forEach((anchorHref) => {
+          const link = document.createElement("a");
+          link.href = anchorHref;
+          link.target = "_blank";
+          link.textContent = `#${anchorHref.split("#")[1]}`;
+          anchors.appendChild(link);
+        });
+        div.appendChild(anchors);
+      }
       if (item.source) {
         const source = document.createElement("p");
         source.className = "checkmark";
@@ -481,11 +397,6 @@ require(["fuse"], function (Fuse) {
     triggerSearch();
   });
 
-  // Initialize search engine/data
-  initializeSearch();
-
-  // Optional: trigger on page load if query param was present
-  if (initialQuery) {
-    triggerSearch();
-  }
+  // Initialize search engine/data, then search the query param if present
+  initializeSearch().then(triggerSearch);
 });
@@ -0,0 +1,652 @@
+/**
+ * @file search-utils.js
+ * @description Helpers used by `search-worker.js` to load and search the search
+ * index files.
+ */
+
+const FUSE_URL = "https://cdn.jsdelivr.net/npm/fuse.js@6.6.2/dist/fuse.min.js";
+
+/**
+ * Fetch and parse a JSON file.
+ * @param {string} url - URL of the JSON file.
+ * @param {RequestInit} init - Options of the request.
+ * @returns {Promise<any>} Promise resolving to the parsed content.
+ */
+async function fetchJSON(url, init = {}) {
+  const response = await fetch(url, init);
+  if (!response.ok) {
+    throw new Error(`[AST]: HTTPS error ${response.statusText}`);
+  }
+  return response.json();
+}
+
+/**
+ * Resolve a path listed in the search manifest into an absolute URL.
+ * @param {string} path - Path relative to the manifest.
+ * @returns {string} Absolute URL.
+ */
+function resolveManifestPath(path) {
+  const manifestUrl = new URL(SEARCH_MANIFEST, self.location.href);
+  return new URL(path, manifestUrl).href;
+}
+
+/**
+ * Open or create an IndexedDB database for caching search indexes.
+ * @param {string} name - Name of the database.
+ * @param {number} version - Version of the database.
+ * @returns {Promise<IDBDatabase>} Promise resolving to the database instance.
+ */
+function openDB(name = "search-cache", version = 1) {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(name, version);
+    request.onerror = () => {
+      console.error("IndexedDB open error:", request.error);
+      reject(request.error);
+    };
+    request.onsuccess = () => {
+      resolve(request.result);
+    };
+    request.onupgradeneeded = (event) => {
+      const db = event.target.result;
+      if (!db.objectStoreNames.contains("indexes")) {
+        db.createObjectStore("indexes");
+      }
+    };
+  });
+}
+
+/**
+ * Retrieve a value from IndexedDB by key.
+ * @param {string} key - The key to look up in the object store.
+ * @returns {Promise<any>} Promise resolving to the retrieved value.
+ */
+async function getFromIDB(key) {
+  const db = await openDB();
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction("indexes", "readonly");
+    const store = transaction.objectStore("indexes");
+    const request = store.get(key);
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+/**
+ * Save a key-value pair to IndexedDB.
+ * @param {string} key - The key to store the value under.
+ * @param {any} value - The value to store.
+ * @returns {Promise<boolean>} Promise resolving when saving is complete.
+ */
+async function saveToIDB(key, value) {
+  const db = await openDB();
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction("indexes", "readwrite");
+    const store = transaction.objectStore("indexes");
+    const request = store.put(value, key);
+    request.onsuccess = () => resolve(true);
+    request.onerror = () => {
+      console.error("Failed to save to IndexedDB:", request.error);
+      reject(request.error);
+    };
+  });
+}
+
+/**
+ * Remove the values stored in IndexedDB under keys starting with a prefix,
+ * except the given ones.
+ * @param {string} prefix - Prefix of the keys to remove.
+ * @param {Set<string>} keep - Keys to keep.
+ * @returns {Promise<void>} Promise resolving once the values are removed.
+ */
+async function pruneIDB(prefix, keep) {
+  const db = await openDB();
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction("indexes", "readwrite");
+    const store = transaction.objectStore("indexes");
+    const request = store.getAllKeys();
+    request.onsuccess = () => {
+      request.result
+        .filter((key) => key.startsWith(prefix) && !keep.has(key))
+        .forEach((key) => store.delete(key));
+    };
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+  });
+}
+
+let searchManifestPromise = null;
+
+/**
+ * Load the manifest describing the search index files.
+ *
+ * The manifest is revalidated with the server on each page view, while the
+ * content-addressed files it lists never change and are cached for good.
+ * @returns {Promise<Object>} Promise resolving to the manifest.
+ */
+function loadSearchManifest() {
+  if (!searchManifestPromise) {
+    searchManifestPromise = fetchJSON(SEARCH_MANIFEST, { cache: "no-cache" });
+    searchManifestPromise.then(pruneSearchCache, () => {
+      // Let the next call try again
+      searchManifestPromise = null;
+    });
+  }
+  return searchManifestPromise;
+}
+
+/**
+ * Load a content-addressed file listed in the search manifest, from IndexedDB
+ * when it was loaded before.
+ *
+ * Files are stored under their absolute URL, which contains the hash of their
+ * content, so a stored file is never outdated.
+ * @param {string} path - Path relative to the manifest.
+ * @returns {Promise<any>} Promise resolving to the parsed content.
+ */
+async function loadSearchFile(path) {
+  const url = resolveManifestPath(path);
+  const cached = await getFromIDB(url).catch(() => undefined);
+  if (cached !== undefined) return cached;
+  const data = await fetchJSON(url);
+  saveToIDB(url, data).catch(() => {});
+  return data;
+}
+
+/**
+ * Remove the files stored in IndexedDB by `loadSearchFile` that are not listed
+ * in the manifest anymore.
+ * @param {Object} manifest - Current search manifest.
+ * @returns {Promise<void>} Promise resolving once the files are removed.
+ */
+function pruneSearchCache(manifest) {
+  const keep = new Set(
+    [...getManifestPaths(manifest)].map((path) => resolveManifestPath(path)),
+  );
+  return pruneIDB(resolveManifestPath(""), keep).catch(() => {});
+}
+
+/**
+ * Get the paths of the files listed in a search manifest, as done by
+ * `get_manifest_files` in `writers.py`.
+ * @param {Object} manifest - Search manifest.
+ * @returns {Set<string>} Paths relative to the manifest.
+ */
+function getManifestPaths(manifest) {
+  const paths = new Set();
+  (manifest.shards || []).forEach((shard) => {
+    paths.add(shard.path);
+    if (shard.fuse_index) paths.add(shard.fuse_index);
+  });
+  Object.values(manifest)
+    .filter((value) => typeof value === "string")
+    .forEach((path) => paths.add(path));
+  return paths;
+}
+
+/**
+ * Decode the entries of a search index file.
+ *
+ * Files in the compact columnar format, written by `compact.py`, store the
+ * object IDs, documents and breadcrumb prefixes once. The `title` and `href`
+ * of each entry are only rebuilt when they are accessed, and so are the
+ * `anchors` of the sections collapsed into it.
+ * @param {Array<Object>|Object} data - Parsed search index file.
+ * @returns {Array<Object>} Search index entries.
+ */
+function decodeSearchIndex(data) {
+  if (Array.isArray(data)) return data;
+  const { objectIDs, documents, prefixes, columns } = data;
+  return columns.text.map((text, position) => {
+    const entry = { text, objectID: objectIDs[columns.objectID[position]] };
+    if (columns.match) entry.match = columns.match[position];
+    if (columns.anchors?.[position].length) {
+      Object.defineProperty(entry, "anchors", {
+        enumerable: true,
+        get() {
+          const document = documents[columns.document[position]];
+          return columns.anchors[position].map(
+            (anchor) => `${document}#${anchor}`,
+          );
+        },
+      });
+    }
+    Object.defineProperties(entry, {
+      title: {
+        enumerable: true,
+        get() {
+          const prefix = columns.prefix[position];
+          const title = columns.title[position];
+          return prefix === -1 ? title : `${prefixes[prefix]} > ${title}`;
+        },
+      },
+      href: {
+        enumerable: true,
+        get() {
+          const document = documents[columns.document[position]];
+          return `${document}#${columns.anchor[position]}`;
+        },
+      },
+    });
+    return entry;
+  });
+}
+
+/**
+ * Load the raw content of the main search index file.
+ * @returns {Promise<Array<Object>|Object>} Promise resolving to the parsed
+ *   file, to be decoded with `decodeSearchIndex`.
+ */
+async function loadSearchData() {
+  const manifest = await loadSearchManifest();
+  return loadSearchFile(
+    SEARCH_OPTIONS.format === "compact" ? manifest.compact : manifest.search,
+  );
+}
+
+/**
+ * Load and decode the entries of the main search index file.
+ * @returns {Promise<Array<Object>>} Promise resolving to the entries.
+ */
+async function loadSearchEntries() {
+  return decodeSearchIndex(await loadSearchData());
+}
+
+/**
+ * Load the Fuse.js index generated at build time for `search.json`.
+ * @returns {Promise<Object>} Promise resolving to the serialized index,
+ *   to be loaded with `Fuse.parseIndex`.
+ */
+async function loadFuseIndex() {
+  const manifest = await loadSearchManifest();
+  return loadSearchFile(manifest.fuse_index);
+}
+
+/**
+ * Load the complete texts of the entries truncated at build time.
+ * @returns {Promise<Object>} Promise resolving to the complete texts, indexed by `href`.
+ */
+async function loadFullTexts() {
+  const manifest = await loadSearchManifest();
+  return manifest.full_text ? loadSearchFile(manifest.full_text) : {};
+}
+
+/**
+ * Split a text into lowercase terms, as done by `tokenize` in `bm25.py`.
+ * @param {string} text - Text to split.
+ * @returns {Array<string>} Terms of the text.
+ */
+function tokenize(text) {
+  return text.toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+}
+
+/**
+ * Remove the diacritics of a text, as done by `fold_diacritics` in `fuse_search.py`.
+ * @param {string} text - Text to fold.
+ * @returns {string} Text without diacritics.
+ */
+function foldDiacritics(text) {
+  return text.normalize("NFKD").replace(/\p{M}/gu, "");
+}
+
+let queryStemmer = null;
+
+/**
+ * Normalize a query as the `match` field of the entries is normalized at build
+ * time by `TextNormalizer` in `fuse_search.py`: terms are folded to lowercase,
+ * stopwords are removed, and the other terms are stemmed and stripped of their
+ * diacritics. Queries are returned unchanged when the entries are not normalized.
+ * @param {string} query - Query typed by the user.
+ * @returns {string} Normalized query.
+ */
+function normalizeQuery(query) {
+  if (!SEARCH_OPTIONS.normalize || typeof Stemmer === "undefined") return query;
+  queryStemmer ??= new Stemmer();
+  // Older versions of Sphinx define the stopwords as an array
+  const isStopword = (term) =>
+    typeof stopwords === "undefined"
+      ? false
+      : stopwords instanceof Set
+        ? stopwords.has(term)
+        : stopwords.includes(term);
+  const normalized = tokenize(query)
+    .filter((term) => !isStopword(term))
+    .map((term) => foldDiacritics(queryStemmer.stemWord(term)))
+    .join(" ");
+  // A query made of stopwords only is searched as it is
+  return normalized || query;
+}
+
+/**
+ * Search engine answering queries with the BM25 inverted index generated at build time.
+ * Results have the same shape as the ones returned by Fuse.js.
+ */
+class BM25Search {
+  /**
+   * @param {Array<Object>} entries - Entries of `search.json`.
+   * @param {Object} index - Inverted index with the sorted `terms` and their `postings`.
+   * @param {number} maxExpansions - Maximum number of terms matching a prefix.
+   */
+  constructor(entries, index, maxExpansions = 50) {
+    this.entries = entries;
+    this.terms = index.terms;
+    this.postings = index.postings;
+    this.maxExpansions = maxExpansions;
+  }
+
+  /**
+   * Find the position of the first term that is not lower than the given one.
+   * @param {string} term
+   * @returns {number}
+   */
+  lowerBound(term) {
+    let low = 0;
+    let high = this.terms.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (this.terms[middle] < term) low = middle + 1;
+      else high = middle;
+    }
+    return low;
+  }
+
+  /**
+   * Get the positions of the index terms matching a query term.
+   * @param {string} term - Query term.
+   * @param {boolean} isPrefix - Whether the term may still be completed.
+   * @returns {Array<number>}
+   */
+  matchTerms(term, isPrefix) {
+    const start = this.lowerBound(term);
+    if (!isPrefix) return this.terms[start] === term ? [start] : [];
+    const matches = [];
+    for (
+      let position = start;
+      position < this.terms.length &&
+      matches.length < this.maxExpansions &&
+      this.terms[position].startsWith(term);
+      position++
+    ) {
+      matches.push(position);
+    }
+    return matches;
+  }
+
+  /**
+   * Search the entries matching a query.
+   * @param {string} query
+   * @param {Object} options - `limit`, and the `objectIDs` of the entries to
+   *   search, all of them being searched when it is empty.
+   * @returns {Array<Object>} Results sorted by relevance.
+   */
+  search(query, { limit = 10, objectIDs = [] } = {}) {
+    const queryTerms = tokenize(normalizeQuery(query));
+    // The last term is being typed unless the query ends with a space
+    const lastIsPrefix = !/\s$/.test(query);
+    const scores = new Map();
+    queryTerms.forEach((term, position) => {
+      const isPrefix = lastIsPrefix && position === queryTerms.length - 1;
+      // A prefix contributes the score of its best completion in each entry
+      const termScores = new Map();
+      this.matchTerms(term, isPrefix).forEach((termPosition) => {
+        const postings = this.postings[termPosition];
+        for (let i = 0; i < postings.length; i += 2) {
+          const score = postings[i + 1];
+          if (score > (termScores.get(postings[i]) || 0)) {
+            termScores.set(postings[i], score);
+          }
+        }
+      });
+      termScores.forEach((score, refIndex) =>
+        scores.set(refIndex, (scores.get(refIndex) || 0) + score),
+      );
+    });
+    const searchedObjectIDs = new Set(objectIDs);
+    return [...scores.entries()]
+      .filter(
+        ([refIndex]) =>
+          searchedObjectIDs.size === 0 ||
+          searchedObjectIDs.has(this.entries[refIndex].objectID),
+      )
+      .sort((a, b) => b[1] - a[1])
+      .slice(0, limit)
+      .map(([refIndex, score]) => ({
+        item: this.entries[refIndex],
+        refIndex,
+        // Lower is better, as with Fuse.js
+        score: 1 / (1 + score),
+      }));
+  }
+}
+
+/**
+ * Create the BM25 search engine for the given entries.
+ * @param {Array<Object>} entries - Entries of `search.json`.
+ * @returns {Promise<BM25Search>} Promise resolving to the search engine.
+ */
+async function loadBM25Search(entries) {
+  const manifest = await loadSearchManifest();
+  const index = await loadSearchFile(manifest.bm25);
+  return new BM25Search(entries, index);
+}
+
+/**
+ * Get the trigrams of the terms of a text, as done by `trigrams` in `trigram.py`.
+ * @param {string} text - Text to split.
+ * @returns {Set<string>} Trigrams of the text.
+ */
+function trigrams(text) {
+  const result = new Set();
+  tokenize(text).forEach((term) => {
+    // Split on code points, as Python does
+    const characters = Array.from(` ${term} `);
+    for (let i = 0; i + 3 <= characters.length; i++) {
+      result.add(characters.slice(i, i + 3).join(""));
+    }
+  });
+  return result;
+}
+
+/**
+ * Index selecting the entries sharing the most trigrams with a query, so that the
+ * fuzzy search of Fuse.js only scores these candidates instead of every entry.
+ */
+class TrigramIndex {
+  /**
+   * @param {Object} index - Trigram index with the sorted `trigrams` and their
+   *   delta-encoded `postings`, written by `trigram.py`.
+   * @param {number} entriesCount - Number of entries in the search index.
+   */
+  constructor(index, entriesCount) {
+    this.postings = new Map(
+      index.trigrams.map((trigram, position) => [
+        trigram,
+        index.postings[position],
+      ]),
+    );
+    this.counts = new Uint16Array(entriesCount);
+  }
+
+  /**
+   * Get the positions of the entries sharing the most trigrams with a query.
+   *
+   * An entry needs to share a third of the trigrams of the query, which lets
+   * entries containing a misspelled form of the query terms through.
+   * @param {string} query - Query, normalized as the indexed text.
+   * @param {number} maxCandidates - Maximum number of entries.
+   * @param {Function} accept - Whether the entry at a position can be selected.
+   * @returns {Array<number>} Positions of the entries, the best candidates first.
+   */
+  candidates(query, maxCandidates, accept = () => true) {
+    const queryTrigrams = [...trigrams(query)];
+    const touched = [];
+    queryTrigrams.forEach((trigram) => {
+      const deltas = this.postings.get(trigram) || [];
+      let position = 0;
+      deltas.forEach((delta) => {
+        position += delta;
+        if (this.counts[position]++ === 0) touched.push(position);
+      });
+    });
+    // Group the entries by number of shared trigrams, which avoids a sort
+    const buckets = Array.from({ length: queryTrigrams.length + 1 }, () => []);
+    touched.forEach((position) => {
+      if (accept(position)) buckets[this.counts[position]].push(position);
+      // Reset the count for the next query
+      this.counts[position] = 0;
+    });
+    const minCount = Math.ceil(queryTrigrams.length / 3);
+    const candidates = [];
+    for (
+      let count = queryTrigrams.length;
+      count >= minCount && candidates.length < maxCandidates;
+      count--
+    ) {
+      candidates.push(
+        ...buckets[count].slice(0, maxCandidates - candidates.length),
+      );
+    }
+    return candidates;
+  }
+}
+
+/**
+ * Index looking up the API symbols by a prefix of their full name or of any of
+ * its dotted suffixes, so that `Bar.me` completes to `ansys.foo.Bar.method`.
+ */
+class SymbolIndex {
+  /**
+   * @param {Object} index - Symbol index with the `types`, `modules`,
+   *   `documents` and `symbols`, written by `symbols.py`.
+   */
+  constructor(index) {
+    this.symbols = index.symbols.map(
+      ([name, module, type, document, anchor]) => {
+        const moduleName = module === -1 ? "" : index.modules[module];
+        return {
+          name: moduleName ? `${moduleName}.${name}` : name,
+          module: moduleName,
+          type: index.types[type],
+          href: `${index.documents[document]}#${anchor}`,
+        };
+      },
+    );
+    // Sorted keys, each of them referencing the position of its symbol
+    this.keys = [];
+    this.symbols.forEach(({ name }, position) => {
+      const key = name.toLowerCase();
+      let start = 0;
+      do {
+        this.keys.push([key.slice(start), position]);
+        start = key.indexOf(".", start) + 1;
+      } while (start > 0);
+    });
+    this.keys.sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+  }
+
+  /**
+   * Find the position of the first key that is not lower than the given one.
+   * @param {string} key
+   * @returns {number}
+   */
+  lowerBound(key) {
+    let low = 0;
+    let high = this.keys.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (this.keys[middle][0] < key) low = middle + 1;
+      else high = middle;
+    }
+    return low;
+  }
+
+  /**
+   * Get the symbols whose name or one of its dotted suffixes starts with a query.
+   * @param {string} query - Beginning of a symbol name, regardless of case.
+   * @param {number} limit - Maximum number of symbols.
+   * @returns {Array<Object>} The full `name`, `module`, `type` and `href` of
+   *   the symbols, the exact matches first.
+   */
+  lookup(query, limit = 10) {
+    const prefix = query.trim().toLowerCase();
+    if (!prefix) return [];
+    const positions = new Set();
+    for (
+      let i = this.lowerBound(prefix);
+      i < this.keys.length &&
+      positions.size < limit &&
+      this.keys[i][0].startsWith(prefix);
+      i++
+    ) {
+      positions.add(this.keys[i][1]);
+    }
+    return [...positions].map((position) => this.symbols[position]);
+  }
+}
+
+/**
+ * Index completing the titles of the sections from their first characters.
+ */
+class TitleIndex {
+  /**
+   * @param {Object} index - Title index with the `documents`, `prefixes` and
+   *   front-coded `titles`, written by `titles.py`.
+   */
+  constructor(index) {
+    let previous = "";
+    this.titles = index.titles.map(
+      ([shared, suffix, document, anchor, prefix]) => {
+        const title = previous.slice(0, shared) + suffix;
+        previous = title;
+        return {
+          key: title.toLowerCase(),
+          title,
+          breadcrumbs: prefix === -1 ? "" : index.prefixes[prefix],
+          href: `${index.documents[document]}#${anchor}`,
+        };
+      },
+    );
+    // Python and JavaScript lowercase and order a few characters differently,
+    // so the titles, already almost sorted, are sorted again
+    this.titles.sort(({ key: a }, { key: b }) => (a < b ? -1 : a > b ? 1 : 0));
+  }
+
+  /**
+   * Find the position of the first title that is not lower than the given key.
+   * @param {string} key
+   * @returns {number}
+   */
+  lowerBound(key) {
+    let low = 0;
+    let high = this.titles.length;
+    while (low < high) {
+      const middle = (low + high) >>> 1;
+      if (this.titles[middle].key < key) low = middle + 1;
+      else high = middle;
+    }
+    return low;
+  }
+
+  /**
+   * Get the sections whose title starts with a query.
+   * @param {string} query - Beginning of a title, regardless of case.
+   * @param {number} limit - Maximum number of sections.
+   * @returns {Array<Object>} The `title`, `breadcrumbs` and `href` of the
+   *   sections, in the order of their title.
+   */
+  lookup(query, limit = 10) {
+    const prefix = query.trim().replace(/\s+/g, " ").toLowerCase();
+    if (!prefix) return [];
+    const sections = [];
+    for (
+      let i = this.lowerBound(prefix);
+      i < this.titles.length &&
+      sections.length < limit &&
+      this.titles[i].key.startsWith(prefix);
+      i++
+    ) {
+      const { title, breadcrumbs, href } = this.titles[i];
+      sections.push({ title, breadcrumbs, href });
+    }
+    return sections;
+  }
+}
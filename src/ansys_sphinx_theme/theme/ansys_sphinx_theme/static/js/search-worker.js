@@ -0,0 +1,505 @@
+/**
+ * @file search-worker.js
+ * @description Web Worker loading the search index and answering the queries of
+ * `search.js` and `search-main.js`, so that parsing the index, accessing
+ * IndexedDB and searching never block the page.
+ *
+ * Messages received:
+ * - `{ type: "init", config }`: load the search index. `config` contains the
+ *   search options, the absolute URLs of the manifest and of the language data,
+ *   whether all the shards are loaded at once, and the extra sources.
+ * - `{ type: "search", id, query, limit, objectIDs, documents, libraries,
+ *   fullText }`: search a query. A query waiting to run is cancelled by the
+ *   next one.
+ * - `{ type: "cancel" }`: cancel the queries waiting to run.
+ * - `{ type: "suggest", id, query, limit }`: look up the API symbols and the
+ *   section titles starting with a query, without waiting for the search index.
+ *
+ * Messages posted:
+ * - `{ type: "ready", objectIDs }`: the first entries are searchable.
+ * - `{ type: "library", library, loaded }`: an extra source is searchable, or
+ *   cannot be loaded.
+ * - `{ type: "results", id, results }`: results of a query, or `null` when it
+ *   was cancelled.
+ * - `{ type: "suggestions", id, symbols, titles }`: API symbols and sections
+ *   found for a query.
+ * - `{ type: "error", message }`: the search index cannot be loaded.
+ */
+
+importScripts("search-utils.js");
+
+// Number of recent queries whose results are kept
+const RESULTS_CACHE_SIZE = 50;
+// Default time given to each extra source to load, in milliseconds
+const EXTRA_SOURCES_TIMEOUT = 10000;
+// Maximum number of entries scored by Fuse.js when a trigram index is available
+const MAX_CANDIDATES = 200;
+
+/**
+ * Map keeping the most recently used values, up to a maximum number.
+ */
+class LRUCache {
+  /**
+   * @param {number} maxSize - Maximum number of values.
+   */
+  constructor(maxSize) {
+    this.maxSize = maxSize;
+    this.values = new Map();
+  }
+
+  /**
+   * Get a value and mark it as the most recently used one.
+   * @param {string} key
+   * @returns {any} The value, or `undefined`.
+   */
+  get(key) {
+    if (!this.values.has(key)) return undefined;
+    const value = this.values.get(key);
+    // Maps iterate in insertion order, so the first key is the least recently used
+    this.values.delete(key);
+    this.values.set(key, value);
+    return value;
+  }
+
+  /**
+   * Set a value, removing the least recently used one if the cache is full.
+   * @param {string} key
+   * @param {any} value
+   */
+  set(key, value) {
+    this.values.delete(key);
+    this.values.set(key, value);
+    if (this.values.size > this.maxSize) {
+      this.values.delete(this.values.keys().next().value);
+    }
+  }
+
+  /**
+   * Remove all the values.
+   */
+  clear() {
+    this.values.clear();
+  }
+}
+
+let engine = null;
+// Entries of the search index and their trigram index, if any
+let searchEntries = [];
+let trigramIndex = null;
+// Fuse.js instance searching the entries of each object ID
+const partitions = new Map();
+let manifest = null;
+let objectIDs = [];
+let fullTexts = null;
+let shardsOnDemand = false;
+let readyPosted = false;
+let latestQueryId = 0;
+const loadedShards = {};
+const libraryEngines = {};
+const resultsCache = new LRUCache(RESULTS_CACHE_SIZE);
+let resolveReady, rejectReady;
+const ready = new Promise((resolve, reject) => {
+  resolveReady = resolve;
+  rejectReady = reject;
+});
+// Failures are reported to the page by the `error` message
+ready.catch(() => {});
+// Indexes of the API symbols and of the titles, `null` when not generated
+let resolveSuggestionIndexes;
+const suggestionIndexes = new Promise((resolve) => {
+  resolveSuggestionIndexes = resolve;
+});
+
+/**
+ * Tell the page that the search can answer queries.
+ */
+function postReady() {
+  if (readyPosted) return;
+  readyPosted = true;
+  resolveReady();
+  self.postMessage({ type: "ready", objectIDs });
+}
+
+/**
+ * Make the entries of an object ID searchable.
+ * @param {string} objectID - Object ID of the entries.
+ * @param {Array<Object>} entries - Decoded search index entries.
+ * @param {Object} [index] - Index generated at build time for the entries, if any.
+ */
+function addPartition(objectID, entries, index) {
+  partitions.set(
+    objectID,
+    new Fuse(
+      entries,
+      // Scores rank the results of all the partitions and extra sources together
+      { ...SEARCH_OPTIONS, includeScore: true },
+      index && Fuse.parseIndex(index),
+    ),
+  );
+  // Results computed without these entries are outdated
+  resultsCache.clear();
+  postReady();
+}
+
+/**
+ * Split the entries of the search index and their index by object ID.
+ * @param {Array<Object>} entries - Decoded search index entries.
+ * @param {Object} [index] - Index generated at build time for the entries, if any.
+ * @returns {Map<string, Object>} The `entries` and the `index` of each object ID.
+ */
+function partitionEntries(entries, index) {
+  const groups = new Map();
+  entries.forEach((entry, position) => {
+    let group = groups.get(entry.objectID);
+    if (!group) {
+      group = { entries: [], index: index && { keys: index.keys, records: [] } };
+      groups.set(entry.objectID, group);
+    }
+    if (index) {
+      // Records reference their entry by its position in the partition
+      const record = index.records[position];
+      group.index.records.push({ ...record, i: group.entries.length });
+    }
+    group.entries.push(entry);
+  });
+  return groups;
+}
+
+/**
+ * Load the shards of the given object IDs that are not loaded yet.
+ * @param {Array<string>} shardObjectIDs - Object IDs whose shards are needed.
+ * @returns {Promise<void>} Promise resolving once the shards are searchable.
+ */
+function ensureShardsLoaded(shardObjectIDs) {
+  const shards = manifest.shards.filter((shard) =>
+    shardObjectIDs.includes(shard.objectID),
+  );
+  shards.forEach((shard) => {
+    loadedShards[shard.path] ??= Promise.all([
+      loadSearchFile(shard.path),
+      shard.fuse_index && loadSearchFile(shard.fuse_index),
+    ])
+      .then(([data, index]) =>
+        addPartition(shard.objectID, decodeSearchIndex(data), index),
+      )
+      .catch((error) => {
+        console.error(`[AST]: Cannot fetch ${shard.path}`, error.message);
+        delete loadedShards[shard.path];
+      });
+  });
+  return Promise.all(shards.map((shard) => loadedShards[shard.path]));
+}
+
+/**
+ * Load the entries of an extra source, from IndexedDB when they were loaded
+ * before, and index them once for the whole session.
+ * @param {string} library - Name of the extra source.
+ * @param {string} libraryUrl - Base URL of the extra source.
+ * @param {number} timeout - Time given to the extra source to respond, in milliseconds.
+ * @returns {Promise<void>} Promise resolving once the entries are searchable.
+ */
+async function loadLibrary(library, libraryUrl, timeout) {
+  const cacheKey = `lib-search-${library}`;
+  let data = await getFromIDB(cacheKey).catch(() => undefined);
+  if (!data) {
+    data = await fetchJSON(`${libraryUrl}/_static/search.json`, {
+      signal: AbortSignal.timeout(timeout),
+    });
+    saveToIDB(cacheKey, data).catch(() => {});
+  }
+  const entries = data.map((entry) => ({
+    title: entry.title,
+    text: entry.text,
+    section: entry.section,
+    link: `${libraryUrl}${entry.href}`,
+    source: library,
+  }));
+  // Entries of other libraries have no normalized `match` field
+  libraryEngines[library] = new Fuse(entries, {
+    ...SEARCH_OPTIONS,
+    keys: ["title", "text"],
+    includeScore: true,
+  });
+  resultsCache.clear();
+}
+
+/**
+ * Load an index answering the suggestions, if it is generated.
+ * @param {string} [path] - Path of the index in the manifest.
+ * @param {Function} SuggestionIndex - Class of the index.
+ * @returns {Promise<Object|null>} Promise resolving to the index, or to `null`
+ *   when it is not generated or cannot be loaded.
+ */
+async function loadSuggestionIndex(path, SuggestionIndex) {
+  if (!path) return null;
+  try {
+    return new SuggestionIndex(await loadSearchFile(path));
+  } catch (error) {
+    console.error(`[AST]: Cannot fetch ${path}`, error.message);
+    return null;
+  }
+}
+
+/**
+ * Load the search index and create the search engine.
+ * @param {Object} config - Configuration sent by the page.
+ */
+async function initialize(config) {
+  self.SEARCH_OPTIONS = config.options;
+  self.SEARCH_MANIFEST = config.manifest;
+  importScripts(FUSE_URL);
+  // Entries stored under fixed keys by previous versions are never revalidated
+  pruneIDB("main-search-", new Set()).catch(() => {});
+  if (SEARCH_OPTIONS.normalize) {
+    // Queries are normalized with the stemmer of `language_data.js`
+    try {
+      self.window = self;
+      importScripts(config.languageData);
+    } catch (error) {
+      console.error("[AST]: Cannot load the language data", error.message);
+    }
+  }
+
+  // Extra sources are loaded concurrently, and each of them is searched as soon
+  // as it is loaded, so that a slow source does not delay the others
+  const timeout =
+    parseInt(SEARCH_OPTIONS.extra_sources_timeout) || EXTRA_SOURCES_TIMEOUT;
+  Object.entries(config.libraries || {}).forEach(([library, libraryUrl]) =>
+    loadLibrary(library, libraryUrl, timeout)
+      .then(() => self.postMessage({ type: "library", library, loaded: true }))
+      .catch((error) => {
+        console.error(
+          `[AST]: Cannot load the search index of ${library}`,
+          error.message,
+        );
+        self.postMessage({ type: "library", library, loaded: false });
+      }),
+  );
+
+  manifest = await loadSearchManifest();
+  // Suggestions are looked up while the search index is still loading
+  resolveSuggestionIndexes(
+    Promise.all([
+      loadSuggestionIndex(manifest.symbols, SymbolIndex),
+      loadSuggestionIndex(manifest.titles, TitleIndex),
+    ]),
+  );
+  if (SEARCH_OPTIONS.engine === "bm25") {
+    const entries = await loadSearchEntries();
+    engine = await loadBM25Search(entries);
+    objectIDs = [...new Set(entries.map((entry) => entry.objectID))];
+    postReady();
+  } else if (manifest.trigrams) {
+    // Fuse.js only scores the candidates selected by the trigram index
+    const [entries, index] = await Promise.all([
+      loadSearchEntries(),
+      loadSearchFile(manifest.trigrams),
+    ]);
+    searchEntries = entries;
+    trigramIndex = new TrigramIndex(index, entries.length);
+    objectIDs = [...new Set(entries.map((entry) => entry.objectID))];
+    postReady();
+  } else if (SEARCH_OPTIONS.shards) {
+    // Each shard is a partition, built at build time
+    objectIDs = manifest.shards.map((shard) => shard.objectID);
+    if (config.preloadShards) {
+      // The shards are searched progressively, as soon as each of them is loaded
+      ensureShardsLoaded(objectIDs);
+    } else {
+      // The shards are loaded on demand, depending on the searched object IDs
+      shardsOnDemand = true;
+      postReady();
+    }
+  } else {
+    const [entries, index] = await Promise.all([
+      loadSearchEntries(),
+      // Parsing the serialized index is much cheaper than indexing the entries
+      SEARCH_OPTIONS.prebuilt_index ? loadFuseIndex() : undefined,
+    ]);
+    const groups = partitionEntries(entries, index);
+    objectIDs = [...groups.keys()];
+    groups.forEach((group, objectID) =>
+      addPartition(objectID, group.entries, group.index),
+    );
+    postReady();
+  }
+}
+
+/**
+ * Search the entries of the documentation.
+ *
+ * Only the partitions of the searched object IDs are searched, so that filtered
+ * searches do not scan the other entries.
+ * @param {string} query - Query typed by the user.
+ * @param {number} limit - Maximum number of results.
+ * @param {Array<string>} searchedObjectIDs - Object IDs to search, or an empty
+ *   array to search all of them.
+ * @returns {Array<Object>} Matching entries and their score, lower being better.
+ */
+function searchDocuments(query, limit, searchedObjectIDs) {
+  let results;
+  if (engine) {
+    // The BM25 engine normalizes the query itself, as it needs its trailing space
+    results = engine.search(query, { limit, objectIDs: searchedObjectIDs });
+  } else if (trigramIndex) {
+    const normalizedQuery = normalizeQuery(query);
+    const searched = new Set(searchedObjectIDs);
+    const candidates = trigramIndex
+      .candidates(
+        normalizedQuery,
+        MAX_CANDIDATES,
+        (position) =>
+          searched.size === 0 || searched.has(searchEntries[position].objectID),
+      )
+      .map((position) => searchEntries[position]);
+    results = new Fuse(candidates, {
+      ...SEARCH_OPTIONS,
+      includeScore: true,
+    }).search(normalizedQuery, { limit });
+  } else {
+    const normalizedQuery = normalizeQuery(query);
+    const searchedPartitions =
+      searchedObjectIDs.length > 0 ? searchedObjectIDs : [...partitions.keys()];
+    results = searchedPartitions.flatMap(
+      (objectID) =>
+        partitions.get(objectID)?.search(normalizedQuery, { limit }) ?? [],
+    );
+  }
+  return results.map(({ item, score }) => ({
+    item: {
+      objectID: item.objectID,
+      href: item.href,
+      title: item.title,
+      text: item.text,
+      // Links of the sections with the same text, collapsed by `dedup`
+      ...(item.anchors && { anchors: item.anchors }),
+    },
+    score,
+  }));
+}
+
+/**
+ * Search the entries of an extra source.
+ * @param {string} library - Name of the extra source.
+ * @param {string} query - Query typed by the user.
+ * @param {number} limit - Maximum number of results.
+ * @returns {Array<Object>} Matching entries and their score, lower being better.
+ */
+function searchLibrary(library, query, limit) {
+  const libraryEngine = libraryEngines[library];
+  return libraryEngine ? libraryEngine.search(query, { limit }) : [];
+}
+
+/**
+ * Replace the truncated texts of the results by their complete texts.
+ * @param {Array<Object>} results - Results of a query.
+ * @returns {Promise<Array<Object>>} Promise resolving to the results.
+ */
+async function addFullTexts(results) {
+  // Only fetched once, when the first results are shown
+  fullTexts ??= loadFullTexts().catch((error) => {
+    console.error("[AST]: Cannot load the complete texts", error.message);
+    return {};
+  });
+  const texts = await fullTexts;
+  return results.map((result) =>
+    result.href && texts[result.href]
+      ? { ...result, text: texts[result.href] }
+      : result,
+  );
+}
+
+/**
+ * Search a query, unless a more recent query cancels it.
+ * @param {Object} request - Search request sent by the page.
+ * @returns {Promise<Array<Object>|null>} Results, or `null` when cancelled.
+ */
+async function search({
+  id,
+  query,
+  limit = 10,
+  objectIDs: searchedObjectIDs = [],
+  documents = true,
+  libraries = [],
+  fullText = false,
+}) {
+  // Let the queries typed in the meantime cancel this one
+  await new Promise((resolve) => setTimeout(resolve));
+  if (id !== latestQueryId) return null;
+
+  const cacheKey = JSON.stringify([
+    query,
+    limit,
+    searchedObjectIDs,
+    documents,
+    libraries,
+    fullText,
+  ]);
+  const cached = resultsCache.get(cacheKey);
+  if (cached) return cached;
+
+  await ready;
+  let results = [];
+  if (documents) {
+    if (shardsOnDemand) {
+      await ensureShardsLoaded(
+        searchedObjectIDs.length > 0 ? searchedObjectIDs : objectIDs,
+      );
+      if (id !== latestQueryId) return null;
+    }
+    results = searchDocuments(query, limit, searchedObjectIDs);
+  }
+  // Extra sources that are not loaded yet are searched once they are
+  libraries.forEach((library) =>
+    results.push(...searchLibrary(library, query, limit)),
+  );
+  // The best results of all the sources are kept, whatever their source
+  results = results
+    .sort((a, b) => a.score - b.score)
+    .slice(0, limit)
+    .map(({ item }) => item);
+  // Only the search page shows the complete texts
+  if (fullText && SEARCH_OPTIONS.full_text) {
+    results = await addFullTexts(results);
+  }
+  resultsCache.set(cacheKey, results);
+  return results;
+}
+
+self.onmessage = ({ data }) => {
+  switch (data.type) {
+    case "init":
+      initialize(data.config).catch((error) => {
+        rejectReady(error);
+        resolveSuggestionIndexes([null, null]);
+        self.postMessage({ type: "error", message: error.message });
+      });
+      break;
+    case "search":
+      latestQueryId = data.id;
+      search(data)
+        .then((results) =>
+          self.postMessage({ type: "results", id: data.id, results }),
+        )
+        .catch((error) => {
+          console.error("[AST]: Search failed", error);
+          self.postMessage({ type: "results", id: data.id, results: [] });
+        });
+      break;
+    case "cancel":
+      latestQueryId = 0;
+      break;
+    case "suggest":
+      suggestionIndexes.then(([symbolIndex, titleIndex]) =>
+        self.postMessage({
+          type: "suggestions",
+          id: data.id,
+          symbols: symbolIndex
+            ? symbolIndex.lookup(data.query, data.limit)
+            : [],
+          titles: titleIndex ? titleIndex.lookup(data.query, data.limit) : [],
+        }),
+      );
+      break;
+  }
+};
@@ -1,26 +1,23 @@
 /**
  * @file search.js
  * @description Client-side search functionality using Fuse.js for the Ansys Sphinx Theme.
+ * The search index is loaded and searched by `search-worker.js`, which is only
+ * started when the reader shows the intent to search.
  */
 
 const MAIN_PAGE_CONTENT = document.querySelector(".bd-main");
-const FUSE_VERSION = "6.4.6";
+// Maximum number of API symbols, and of titles, shown above the search results
+const SUGGESTION_LIMIT = 5;
 let SEARCH_BAR,
   RESULTS_CONTAINER,
   SEARCH_INPUT,
   CURRENT_INDEX = -1,
-  fuseInstance;
+  searchWorker,
+  // Latest suggestions and search results, along with their query
+  suggestionResults = { query: "", items: [] },
+  searchResults = { query: "", items: [] };
 
-/**
- * Load fuse.js from CDN and initialize search functionality.
- */
-require.config({
-  paths: {
-    fuse: `https://cdn.jsdelivr.net/npm/fuse.js@${FUSE_VERSION}/dist/fuse.min`,
-  },
-});
-
-require(["fuse"], (Fuse) => {
+document.addEventListener("DOMContentLoaded", () => {
   /**
    * Debounce utility to limit function execution rate.
    * @param {Function} func
@@ -88,6 +85,7 @@ require(["fuse"], (Fuse) => {
     SEARCH_INPUT.value = "";
     MAIN_PAGE_CONTENT.classList.remove("blurred");
     CURRENT_INDEX = -1;
+    searchWorker?.cancel();
 
     const modalSidebar = document.querySelector(
       "#pst-primary-sidebar-modal > div.sidebar-primary-items__start.sidebar-primary__section",
@@ -123,7 +121,7 @@ require(["fuse"], (Fuse) => {
   }
 
   /**
-   * Display search results from Fuse.
+   * Display the search results.
    * @param {Array} results
    */
   function displayResults(results) {
@@ -131,7 +129,7 @@ require(["fuse"], (Fuse) => {
     if (!results.length) return noResultsFoundBanner();
 
     const fragment = document.createDocumentFragment();
-    results.forEach(({ item: { title, text, href } }) => {
+    results.forEach(({ title, text, href, anchors }) => {
       const resultItem = document.createElement("div");
       resultItem.className = "result-item";
       resultItem.dataset.href = href;
@@ -149,6 +147,23 @@ require(["fuse"], (Fuse) => {
       resultText.textContent = truncateTextPreview(text);
 
       resultItem.append(resultTitle, resultText);
+      // Sections with the same text, collapsed into this result by `dedup`
+      if (anchors?.length) {
+        const resultAnchors = document.createElement("div");
+        resultAnchors.className = "result-anchors";
+        anchors.forEach((anchorHref) => {
+          const link = document.createElement("a");
+          link.href = getDynamicPath(anchorHref);
+          link.textContent = `#${anchorHref.split("#")[1]}`;
+          // Follow the link instead of the result
+          link.addEventListener("click", (event) => {
+            event.stopPropagation();
+            collapseSearchInput();
+          });
+          resultAnchors.appendChild(link);
+        });
+        resultItem.appendChild(resultAnchors);
+      }
       fragment.appendChild(resultItem);
     });
 
@@ -171,6 +186,55 @@ require(["fuse"], (Fuse) => {
     RESULTS_CONTAINER.style.display = "flex";
   }
 
+  /**
+   * Display the suggestions and the search results found for the current query.
+   * The suggestions come first, as they are looked up as soon as it is typed.
+   */
+  function displayCurrentResults() {
+    const query = SEARCH_INPUT.value.trim();
+    const suggestions =
+      suggestionResults.query === query ? suggestionResults.items : [];
+    const results = searchResults.query === query ? searchResults.items : [];
+    const suggestionHrefs = new Set(suggestions.map(({ href }) => href));
+    displayResults([
+      ...suggestions,
+      ...results.filter(({ href }) => !suggestionHrefs.has(href)),
+    ]);
+  }
+
+  /**
+   * Look up the API symbols and the section titles starting with the query,
+   * without waiting for the debounced search.
+   */
+  function showSuggestions() {
+    const query = SEARCH_INPUT.value.trim();
+    if (
+      !query ||
+      !(SEARCH_OPTIONS.symbol_index || SEARCH_OPTIONS.title_index)
+    ) {
+      return;
+    }
+    startSearch()
+      .then((worker) => worker.suggest(query, { limit: SUGGESTION_LIMIT }))
+      .then(({ symbols, titles }) => {
+        if (SEARCH_INPUT.value.trim() !== query) return;
+        const items = [
+          ...symbols.map(({ name, type, href }) => ({
+            title: name,
+            text: type,
+            href,
+          })),
+          ...titles.map(({ title, breadcrumbs, href }) => ({
+            title,
+            text: breadcrumbs,
+            href,
+          })),
+        ];
+        suggestionResults = { query, items };
+        if (items.length) displayCurrentResults();
+      });
+  }
+
   /**
    * Focus the currently selected result item.
    * @param {NodeList} resultsItems
@@ -262,6 +326,7 @@ require(["fuse"], (Fuse) => {
     } else {
       RESULTS_CONTAINER.style.display = "none";
     }
+    showSuggestions();
     handleSearchInput();
   }
 
@@ -273,10 +338,17 @@ require(["fuse"], (Fuse) => {
       const query = SEARCH_INPUT.value.trim();
       if (!query) return (RESULTS_CONTAINER.style.display = "none");
 
-      const searchResults = fuseInstance.search(query, {
-        limit: parseInt(SEARCH_OPTIONS.limit),
-      });
-      displayResults(searchResults);
+      startSearch()
+        .then((worker) =>
+          worker.search(query, { limit: parseInt(SEARCH_OPTIONS.limit) }),
+        )
+        .then((results) => {
+          // Results of a cancelled or outdated query are not shown
+          if (results && SEARCH_INPUT.value.trim() === query) {
+            searchResults = { query, items: results };
+            displayCurrentResults();
+          }
+        });
     },
     parseInt(SEARCH_OPTIONS.delay) || 300,
   );
@@ -302,6 +374,7 @@ require(["fuse"], (Fuse) => {
     }
     SEARCH_INPUT = SEARCH_BAR.querySelector(".bd-search input.form-control");
     if (SEARCH_INPUT) {
+      SEARCH_INPUT.addEventListener("focus", startSearch);
       SEARCH_INPUT.addEventListener("click", expandSearchInput);
       SEARCH_INPUT.addEventListener("keydown", handleKeyDownSearchInput);
       SEARCH_INPUT.addEventListener("input", handleInputEvent);
@@ -314,7 +387,10 @@ require(["fuse"], (Fuse) => {
    */
   function handleGlobalKeyDown(event) {
     if (event.key === "Escape") collapseSearchInput();
-    else if (event.key === "k" && event.ctrlKey) expandSearchInput();
+    else if (event.key === "k" && event.ctrlKey) {
+      startSearch();
+      expandSearchInput();
+    }
   }
 
   /**
@@ -330,14 +406,28 @@ require(["fuse"], (Fuse) => {
     }
   }
 
+  let searchWorkerPromise = null;
+
   /**
-   * Initialize Fuse with the given data and options.
-   * @param {Array} data
-   * @param {Object} options
+   * Start the search worker, which loads the search index, unless it is started.
+   * @returns {Promise<Object>} Promise resolving to the client of the worker.
    */
-  function initializeFuse(data, options) {
-    fuseInstance = new Fuse(data, options);
-    document.documentElement.setAttribute("data-fuse_active", "true");
+  function startSearch() {
+    searchWorkerPromise ??= import("./search-client.js").then(
+      ({ SearchWorkerClient }) => {
+        // The shards are searched progressively, as soon as each of them is loaded
+        searchWorker = new SearchWorkerClient({ preloadShards: true });
+        searchWorker.ready
+          .then(() =>
+            document.documentElement.setAttribute("data-fuse_active", "true"),
+          )
+          .catch((error) =>
+            console.error("[AST]: Cannot load the search index", error.message),
+          );
+        return searchWorker;
+      },
+    );
+    return searchWorkerPromise;
   }
 
   // Initialize search functionality on page load
@@ -346,14 +436,10 @@ require(["fuse"], (Fuse) => {
   document.addEventListener("keydown", handleGlobalKeyDown);
   document.addEventListener("click", handleGlobalClick);
 
-  fetch(SEARCH_FILE)
-    .then((response) => {
-      if (!response.ok)
-        throw new Error(`[AST]: HTTPS error ${response.statusText}`);
-      return response.json();
-    })
-    .then((SEARCH_DATA) => initializeFuse(SEARCH_DATA, SEARCH_OPTIONS))
-    .catch((error) =>
-      console.error(`[AST]: Cannot fetch ${SEARCH_FILE}`, error.message),
-    );
+  // Pages where nobody searches do not load the search index, unless it is
+  // preloaded once the browser is idle
+  if (SEARCH_OPTIONS.preload_on_idle) {
+    if ("requestIdleCallback" in window) requestIdleCallback(startSearch);
+    else window.addEventListener("load", () => setTimeout(startSearch));
+  }
 });
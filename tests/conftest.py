@@ -0,0 +1,158 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fixtures of the tests building a sample documentation with the theme."""
+
+from io import StringIO
+
+import pytest
+from sphinx.testing.util import SphinxTestApp
+
+# The handlers of the search are connected like in the ``setup`` of the theme, so
+# that the search index is built without the compiled assets of the theme
+CONF = """
+from ansys_sphinx_theme import precompress_build_files
+from ansys_sphinx_theme.search import (
+    collect_search_index,
+    create_search_index,
+    update_search_config,
+)
+
+project = "Sample"
+html_theme_options = {theme_options!r}
+
+
+def setup(app):
+    update_search_config(app)
+    app.connect("doctree-resolved", collect_search_index, priority=900)
+    app.connect("build-finished", create_search_index)
+    app.connect("build-finished", precompress_build_files, priority=900)
+"""
+
+SAMPLE_PAGES = {
+    "index": """
+Sample
+======
+
+Welcome to the sample documentation.
+
+.. toctree::
+
+   getting-started
+   guide/index
+   api/index
+""",
+    "getting-started": """
+Getting started
+===============
+
+Install the package with pip.
+
+Usage
+-----
+
+Import the package and call its functions.
+""",
+    "guide/index": """
+User guide
+==========
+
+Guides on each feature of the package.
+
+.. toctree::
+
+   install
+   options
+   search
+""",
+    "guide/install": """
+Installing
+==========
+
+Installing the package requires Python.
+
+From sources
+------------
+
+Clone the repository and install it in editable mode.
+""",
+    "guide/options": """
+Options
+=======
+
+Options of the theme are set in ``html_theme_options``.
+""",
+    "guide/search": """
+Search
+======
+
+The static search is built at documentation build time.
+
+Filters
+-------
+
+Search filters restrict the results to a part of the documentation.
+""",
+    "api/index": """
+API reference
+=============
+
+Functions and classes of the package.
+
+.. toctree::
+
+   functions
+""",
+    "api/functions": """
+Functions
+=========
+
+.. py:function:: sample.run(name)
+
+   Run a task by its name.
+
+.. py:function:: sample.stop(name)
+
+   Stop a running task.
+""",
+}
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Get a function creating the Sphinx application of a sample documentation.
+
+    The sources are written on the first call for a name, so that later calls with the
+    same name build the same documentation again.
+    """
+    apps = []
+
+    def make(theme_options=None, name="docs", pages=SAMPLE_PAGES, **kwargs):
+        srcdir = tmp_path / name
+        if not srcdir.exists():
+            for docname, content in pages.items():
+                path = srcdir / f"{docname}.rst"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content, encoding="utf-8")
+            conf = CONF.format(theme_options=theme_options or {})
+            (srcdir / "conf.py").write_text(conf, encoding="utf-8")
+        app = SphinxTestApp("html", srcdir=srcdir, status=StringIO(), warning=StringIO(), **kwargs)
+        apps.append(app)
+        return app
+
+    yield make
+    for app in apps:
+        app.cleanup()
@@ -0,0 +1,89 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the precompression of the files of the HTML build."""
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+
+from ansys_sphinx_theme.compression import compress_files, get_compressors
+from ansys_sphinx_theme.search.writers import SEARCH_INDEX_DIR
+
+
+def test_compress_files(tmp_path):
+    """Compressed siblings are written once, and again when their file changes."""
+    file_path = tmp_path / "search.json"
+    file_path.write_text("[" + ",".join(['{"title":"Install"}'] * 100) + "]")
+
+    assert compress_files([file_path], ["gzip"]) == 1
+    compressed_path = tmp_path / "search.json.gz"
+    assert gzip.decompress(compressed_path.read_bytes()) == file_path.read_bytes()
+
+    # Unchanged files are skipped
+    mtime = compressed_path.stat().st_mtime_ns
+    assert compress_files([file_path], ["gzip"]) == 0
+    assert compressed_path.stat().st_mtime_ns == mtime
+
+    file_path.write_text("[]" * 100)
+    newer = mtime + 1_000_000_000
+    os.utime(file_path, ns=(newer, newer))
+    assert compress_files([file_path], ["gzip"]) == 1
+    assert gzip.decompress(compressed_path.read_bytes()) == file_path.read_bytes()
+
+
+def test_incompressible_files(tmp_path):
+    """No sibling is written when it would not be smaller than the file."""
+    file_path = tmp_path / "tiny.js"
+    file_path.write_text("a")
+
+    assert compress_files([file_path], ["gzip"]) == 0
+    assert not (tmp_path / "tiny.js.gz").exists()
+
+
+def test_invalid_format():
+    """Unknown compression formats are rejected."""
+    with pytest.raises(ValueError, match="Invalid compression format: 'zip'"):
+        get_compressors(["zip"])
+
+
+def test_precompress_build(make_app):
+    """The search index files are compressed, and only again when they change."""
+    theme_options = {"precompress": {"formats": ["gzip"]}}
+    app = make_app(theme_options)
+    app.build()
+
+    static_dir = Path(app.outdir) / "_static"
+    search_path = static_dir / "search.json"
+    assert gzip.decompress((static_dir / "search.json.gz").read_bytes()) == (
+        search_path.read_bytes()
+    )
+    compressed_paths = list((static_dir / SEARCH_INDEX_DIR).glob("*.json.gz"))
+    assert compressed_paths
+    mtimes = {path: path.stat().st_mtime_ns for path in compressed_paths}
+
+    app = make_app(theme_options)
+    app.build()
+
+    # Only search.json is written again, the small manifest not being compressed
+    assert "Precompressed 1 files with gzip" in app.status.getvalue()
+    # Content-addressed files are not written again, so neither are their siblings
+    assert {path: path.stat().st_mtime_ns for path in compressed_paths} == mtimes
+    assert gzip.decompress((static_dir / "search.json.gz").read_bytes()) == (
+        search_path.read_bytes()
+    )
@@ -0,0 +1,71 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the BM25 inverted index."""
+
+from sphinx.search.en import SearchEnglish
+
+from ansys_sphinx_theme.search.bm25 import BM25IndexBuilder, tokenize
+from ansys_sphinx_theme.search.fuse_search import TextNormalizer
+
+ENTRIES = [
+    {"title": "Installing", "text": "Install the package with pip."},
+    {"title": "Usage", "text": "Import the package."},
+    {"title": "Theme options", "text": "Options of the theme, such as the logo."},
+]
+
+
+def _postings(index, term):
+    """Get the postings of a term as a dictionary of scores by entry position."""
+    flat_postings = index["postings"][index["terms"].index(term)]
+    return dict(zip(flat_postings[::2], flat_postings[1::2]))
+
+
+def test_tokenize():
+    """Texts are split into lowercase terms."""
+    assert tokenize("Install the_package, v1.2!") == ["install", "the", "package", "v1", "2"]
+
+
+def test_bm25_postings():
+    """Each term lists the entries containing it with their score."""
+    builder = BM25IndexBuilder()
+    for entry in ENTRIES:
+        builder.add(entry)
+
+    index = builder.build()
+
+    assert index["terms"] == sorted(index["terms"])
+    assert _postings(index, "package").keys() == {0, 1}
+    assert _postings(index, "logo").keys() == {2}
+    # Rare terms score higher than frequent ones
+    assert _postings(index, "logo")[2] > _postings(index, "the")[2]
+    # Terms of the title are boosted
+    assert _postings(index, "theme")[2] > _postings(index, "logo")[2]
+
+
+def test_bm25_normalized_titles():
+    """Titles are normalized like the text and the queries."""
+    normalizer = TextNormalizer(SearchEnglish({}))
+    builder = BM25IndexBuilder(normalizer)
+    for entry in ENTRIES:
+        builder.add({**entry, "match": normalizer.normalize(entry["text"])})
+
+    index = builder.build()
+
+    (stem,) = normalizer.normalize("installing").split()
+    assert stem in index["terms"]
+    assert "installing" not in index["terms"]
+    assert _postings(index, stem).keys() == {0}
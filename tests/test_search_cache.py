@@ -0,0 +1,127 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the search index cache."""
+
+from types import SimpleNamespace
+
+from docutils import nodes
+import pytest
+
+from ansys_sphinx_theme.search.cache import SearchIndexCache
+
+
+def _title(text):
+    """Get the title node of a document, as stored in ``env.titles``."""
+    return nodes.title("", text)
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Build a Sphinx application with two documents."""
+    doctree_dir = tmp_path / "doctrees"
+    (doctree_dir / "guide").mkdir(parents=True)
+    for docname in ("index", "guide/install"):
+        (doctree_dir / f"{docname}.doctree").write_bytes(b"doctree")
+    return SimpleNamespace(
+        env=SimpleNamespace(titles={"index": _title("Home"), "guide": _title("Guide")}),
+        doctreedir=str(doctree_dir),
+        config=SimpleNamespace(html_search_language=None, language="en"),
+    )
+
+
+ENTRIES = [{"title": "Install", "href": "guide/install.html#install", "text": "Run pip."}]
+
+
+def test_store_and_load(app):
+    """Stored entries are loaded back in the next build."""
+    cache = SearchIndexCache(app, {}, {})
+    cache.store("guide/install", ENTRIES)
+    cache.save()
+
+    cache = SearchIndexCache(app, {}, {})
+    assert cache.outdated(["index", "guide/install"]) == ["index"]
+    assert cache.load("guide/install") == ENTRIES
+
+
+def test_shard_does_not_collide_with_manifest(app):
+    """A document named like the manifest does not overwrite it."""
+    cache = SearchIndexCache(app, {}, {})
+    app.env.titles["manifest"] = _title("Manifest")
+    (cache.doctree_dir / "manifest.doctree").write_bytes(b"doctree")
+    cache.store("manifest", ENTRIES)
+    cache.save()
+
+    cache = SearchIndexCache(app, {}, {})
+    assert cache.outdated(["manifest"]) == []
+    assert cache.load("manifest") == ENTRIES
+
+
+def test_options_invalidate_cache(app):
+    """Changing the options affecting the entries makes every document outdated."""
+    cache = SearchIndexCache(app, {}, {})
+    cache.store("index", ENTRIES)
+    cache.save()
+
+    assert SearchIndexCache(app, {}, {}).outdated(["index"]) == []
+    assert SearchIndexCache(app, {"dedup": True}, {}).outdated(["index"]) == ["index"]
+    assert SearchIndexCache(app, {}, {"Guide": ["guide"]}).outdated(["index"]) == ["index"]
+    app.config.language = "fr"
+    assert SearchIndexCache(app, {}, {}).outdated(["index"]) == ["index"]
+
+
+def test_other_options_keep_cache(app):
+    """Changing the options that do not affect the entries keeps the cache."""
+    cache = SearchIndexCache(app, {"dedup": True}, {})
+    cache.store("index", ENTRIES)
+    cache.save()
+
+    options = {
+        "dedup": True,
+        "limit": 20,
+        "threshold": 0.5,
+        "delay": 500,
+        "report": True,
+        "max_index_size": 1000,
+        "precompress": ["gzip"],
+    }
+    assert SearchIndexCache(app, options, {}).outdated(["index"]) == []
+
+
+def test_changed_document_is_outdated(app):
+    """A document is outdated when its doctree or a parent title changes."""
+    cache = SearchIndexCache(app, {}, {})
+    for docname in ("index", "guide/install"):
+        cache.store(docname, ENTRIES)
+    cache.save()
+
+    (cache.doctree_dir / "index.doctree").write_bytes(b"new doctree")
+    app.env.titles["guide"] = _title("User guide")
+    cache = SearchIndexCache(app, {}, {})
+    assert cache.outdated(["index", "guide/install"]) == ["index", "guide/install"]
+
+
+def test_prune(app):
+    """Documents no longer included are dropped along with their shard."""
+    cache = SearchIndexCache(app, {}, {})
+    for docname in ("index", "guide/install"):
+        cache.store(docname, ENTRIES)
+    shard_path = cache._shard_path("guide/install")
+    cache.prune(["index"])
+    cache.save()
+
+    assert not shard_path.exists()
+    assert SearchIndexCache(app, {}, {}).signatures.keys() == {"index"}
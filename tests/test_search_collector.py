@@ -0,0 +1,72 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the collection of the search index entries during the write phase."""
+
+import json
+from pathlib import Path
+
+from ansys_sphinx_theme.search.cache import SEARCH_INDEX_CACHE_DIR
+
+
+def _read_search_index(app):
+    """Read the entries of ``search.json``."""
+    return json.loads((Path(app.outdir) / "_static" / "search.json").read_text())
+
+
+def test_written_documents_are_not_read_again(make_app):
+    """Documents written during the build are indexed from their resolved doctree."""
+    app = make_app()
+    read_docs = []
+
+    def watch_doctrees(app, exception):
+        # Runs just before ``create_search_index``
+        get_doctree = app.env.get_doctree
+
+        def read_doctree(docname):
+            read_docs.append(docname)
+            return get_doctree(docname)
+
+        app.env.get_doctree = read_doctree
+
+    app.connect("build-finished", watch_doctrees, priority=400)
+    app.build()
+
+    assert read_docs == []
+    assert "Updating the search index for 0 of 8 documents" in app.status.getvalue()
+    assert {entry["href"] for entry in _read_search_index(app)} >= {
+        "index.html#sample",
+        "guide/install.html#from-sources",
+        "api/functions.html#sample.run",
+    }
+
+
+def test_spool_directory_is_removed(make_app):
+    """Without the cache, the entries are spooled to a directory removed afterwards."""
+    app = make_app({"static_search": {"cache": False}})
+    spool_dirs = []
+
+    def find_spool_directory(app, exception):
+        spool_dirs.append(Path(app._ast_search_collector.spool_dir.name))
+        assert list(spool_dirs[0].rglob("*.pickle"))
+
+    app.connect("build-finished", find_spool_directory, priority=400)
+    app.build()
+
+    assert not spool_dirs[0].exists()
+    assert not (Path(app.doctreedir) / SEARCH_INDEX_CACHE_DIR).exists()
+    assert app._ast_search_collector is None
+    assert len(_read_search_index(app)) > 8
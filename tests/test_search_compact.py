@@ -0,0 +1,99 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the compact columnar format of the search index."""
+
+from ansys_sphinx_theme.search.compact import BREADCRUMB_SEPARATOR, CompactIndexEncoder
+
+ENTRIES = [
+    {
+        "objectID": "Guide",
+        "href": "guide/install.html#install",
+        "title": "Guide > Install",
+        "text": "Install the package.",
+    },
+    {
+        "objectID": "Guide",
+        "href": "guide/install.html#pip",
+        "title": "Guide > Install > pip",
+        "text": "Run pip.",
+        "anchors": ["guide/install.html#uv", "guide/install.html#conda"],
+    },
+    {
+        "objectID": "Home",
+        "href": "index.html",
+        "title": "Home",
+        "text": "Welcome.",
+    },
+]
+
+
+def decode(index):
+    """Rebuild the entries of a compact index, like ``decodeSearchIndex``."""
+    columns = index["columns"]
+    entries = []
+    for position, text in enumerate(columns["text"]):
+        document = index["documents"][columns["document"][position]]
+        anchor = columns["anchor"][position]
+        prefix = columns["prefix"][position]
+        title = columns["title"][position]
+        entry = {
+            "objectID": index["objectIDs"][columns["objectID"][position]],
+            "href": f"{document}#{anchor}" if anchor else document,
+            "title": (
+                f"{index['prefixes'][prefix]}{BREADCRUMB_SEPARATOR}{title}"
+                if prefix != -1
+                else title
+            ),
+            "text": text,
+        }
+        if "match" in columns:
+            entry["match"] = columns["match"][position]
+        if columns.get("anchors", [[]] * len(columns["text"]))[position]:
+            entry["anchors"] = [f"{document}#{anchor}" for anchor in columns["anchors"][position]]
+        entries.append(entry)
+    return entries
+
+
+def _encode(entries):
+    """Encode entries in the compact format."""
+    encoder = CompactIndexEncoder()
+    for entry in entries:
+        encoder.add(entry)
+    return encoder.encode()
+
+
+def test_round_trip():
+    """Decoded entries are the encoded ones."""
+    assert decode(_encode(ENTRIES)) == ENTRIES
+
+
+def test_round_trip_normalized():
+    """The normalized text of the entries is kept."""
+    entries = [{**entry, "match": entry["text"].lower()} for entry in ENTRIES]
+
+    assert decode(_encode(entries)) == entries
+
+
+def test_string_tables():
+    """Repeated values are stored once."""
+    index = _encode(ENTRIES)
+
+    assert index["objectIDs"] == ["Guide", "Home"]
+    assert index["documents"] == ["guide/install.html", "index.html"]
+    assert index["prefixes"] == ["Guide", "Guide > Install"]
+    assert index["columns"]["prefix"] == [0, 1, -1]
+    assert index["columns"]["anchors"] == [[], ["uv", "conda"], []]
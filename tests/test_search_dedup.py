@@ -0,0 +1,73 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the deduplication of the search index entries."""
+
+from ansys_sphinx_theme.search.dedup import deduplicate_entries
+
+
+def _entry(anchor, text):
+    """Get a search index entry of a section."""
+    return {"title": anchor, "href": f"page.html#{anchor}", "text": text}
+
+
+def test_identical_texts_are_collapsed():
+    """Entries with the same text, up to case and whitespace, are collapsed."""
+    entries = [
+        _entry("first", "Install the package."),
+        _entry("other", "Configure the theme."),
+        _entry("second", "install  the\npackage."),
+    ]
+
+    kept = deduplicate_entries(entries)
+
+    assert [entry["href"] for entry in kept] == ["page.html#first", "page.html#other"]
+    assert kept[0]["anchors"] == ["page.html#second"]
+    assert "anchors" not in kept[1]
+
+
+def test_contained_texts_are_collapsed():
+    """A text contained in a text of about the same length is collapsed."""
+    text = "The theme supports a static search built at documentation build time"
+    entries = [_entry("long", f"{text}."), _entry("short", text)]
+
+    kept = deduplicate_entries(entries)
+
+    assert [entry["href"] for entry in kept] == ["page.html#long"]
+    assert kept[0]["anchors"] == ["page.html#short"]
+
+
+def test_shorter_contained_texts_are_kept():
+    """A text much shorter than the text containing it is kept."""
+    entries = [_entry("long", "Install the package with pip."), _entry("short", "pip")]
+
+    kept = deduplicate_entries(entries)
+
+    assert [entry["href"] for entry in kept] == ["page.html#long", "page.html#short"]
+    assert deduplicate_entries(entries, ratio=0.1)[0]["anchors"] == ["page.html#short"]
+
+
+def test_section_of_api_object():
+    """A section documenting an API object is only collapsed with a lower ratio."""
+    entries = [
+        _entry("functions", "Functions of the package. sample.run(name) Run a task."),
+        _entry("sample.run", "sample.run(name) Run a task."),
+    ]
+
+    assert len(deduplicate_entries(entries)) == 2
+    kept = deduplicate_entries(entries, ratio=0.5)
+    assert [entry["href"] for entry in kept] == ["page.html#functions"]
+    assert kept[0]["anchors"] == ["page.html#sample.run"]
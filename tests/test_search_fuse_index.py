@@ -0,0 +1,83 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the records of the Fuse.js index built at build time."""
+
+from ansys_sphinx_theme.search.fuse_index import fuse_field_norm, fuse_key, fuse_record
+
+KEYS = [fuse_key(key) for key in ["title", "text", "objectID", {"name": "meta.rank"}]]
+
+
+def test_fuse_key():
+    """Keys are converted like ``createKey`` in Fuse.js."""
+    assert fuse_key({"name": "meta.rank", "weight": 2}) == {
+        "path": ["meta", "rank"],
+        "id": "meta.rank",
+        "weight": 2,
+        "src": "meta.rank",
+        "getFn": None,
+    }
+
+
+def test_field_norm():
+    """The norm of a value depends on its number of tokens separated by spaces."""
+    assert fuse_field_norm("pip") == 1
+    assert fuse_field_norm("install  the   package") == 0.577
+    assert fuse_field_norm(" install\tthe\npackage ") == 1
+    assert fuse_field_norm("a b c d e f g h") == 0.354
+
+
+def test_record():
+    """Records are built like ``FuseIndex._addObject`` in Fuse.js 6.6.2."""
+    entry = {
+        "title": " \t\u00a0",
+        "text": "Install  the   package",
+        "objectID": 42,
+        "meta": {"rank": True},
+    }
+
+    assert fuse_record(entry, 5, KEYS) == {
+        "i": 5,
+        "$": {
+            "1": {"v": "Install  the   package", "n": 0.577},
+            "2": {"v": "42", "n": 1},
+            "3": {"v": "true", "n": 1},
+        },
+    }
+
+
+def test_record_missing_values():
+    """Missing and ``None`` values are not indexed."""
+    entry = {"title": "Install", "text": None, "meta": "rank"}
+
+    assert fuse_record(entry, 0, KEYS) == {"i": 0, "$": {"0": {"v": "Install", "n": 1}}}
+
+
+def test_record_lists():
+    """Strings in lists are indexed with their position, in the order of Fuse.js."""
+    entry = {"title": ["API", " ", ["Guide", 3], "User guide"], "meta": [{"rank": 1.0}]}
+
+    assert fuse_record(entry, 1, KEYS) == {
+        "i": 1,
+        "$": {
+            "0": [
+                {"v": "User guide", "i": 3, "n": 0.707},
+                {"v": "Guide", "i": 0, "n": 1},
+                {"v": "API", "i": 0, "n": 1},
+            ],
+            "3": [{"v": "1", "i": 0, "n": 1}],
+        },
+    }
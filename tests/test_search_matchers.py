@@ -0,0 +1,69 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the matchers selecting the documents of the search index."""
+
+from ansys_sphinx_theme.search.fuse_search import SearchExclusionMatcher, SearchFilterMatcher
+
+
+def test_filter_matcher():
+    """Documents get the first filter with a prefix of their name."""
+    matcher = SearchFilterMatcher(
+        {
+            "User guide": ["user-guide/", "getting-started"],
+            "Installation": ["user-guide/install"],
+            "API": ["api/"],
+        }
+    )
+
+    assert matcher.match("user-guide/options") == "User guide"
+    assert matcher.match("user-guide/install") == "User guide"
+    assert matcher.match("getting-started") == "User guide"
+    assert matcher.match("api/ansys/theme") == "API"
+    assert matcher.match("index") is None
+
+
+def test_filter_matcher_longer_prefix():
+    """A longer prefix of an earlier filter is preferred to a shorter one."""
+    matcher = SearchFilterMatcher({"Installation": ["guide/install"], "Guide": ["guide"]})
+
+    assert matcher.match("guide/install") == "Installation"
+    assert matcher.match("guide/usage") == "Guide"
+
+
+def test_exclusion_matcher(tmp_path):
+    """Documents are excluded by name, parent directory, pattern or metadata."""
+    matcher = SearchExclusionMatcher(
+        ["changelog", "examples/", "api/**/private", str(tmp_path / "draft")],
+        tmp_path,
+        metadata={"secret": {"nosearch": ""}},
+    )
+
+    assert matcher.match("changelog")
+    assert not matcher.match("changelog-old")
+    assert matcher.match("examples/index")
+    assert matcher.match("api/ansys/private")
+    assert matcher.match("draft/page")
+    assert matcher.match("secret")
+    assert not matcher.match("index")
+
+
+def test_exclusion_matcher_root():
+    """The source directory itself excludes every document."""
+    for rule in (".", "", "./"):
+        matcher = SearchExclusionMatcher([rule], "/src")
+        assert matcher.match("index")
+        assert matcher.match("guide/install")
@@ -0,0 +1,81 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the normalization of the indexed text."""
+
+import json
+from pathlib import Path
+
+from sphinx.search.en import SearchEnglish
+from sphinx.search.fr import SearchFrench
+
+from ansys_sphinx_theme.search.fuse_search import (
+    NORMALIZED_SNIPPET_LENGTH,
+    TextNormalizer,
+    get_search_language,
+    get_text_normalizer,
+)
+
+
+def test_normalizer():
+    """Stopwords are removed and the other terms are stemmed without diacritics."""
+    normalizer = TextNormalizer(SearchEnglish({}))
+
+    assert normalizer.normalize("The installing of the Packages in a café, naïvely!") == (
+        "instal packag cafe naiv"
+    )
+
+
+def test_normalizer_language():
+    """The stopwords and the stemmer are the ones of the language."""
+    normalizer = TextNormalizer(SearchFrench({}))
+
+    assert normalizer.normalize("Le installation des paquets est très rapide") == (
+        "install paquet tres rapid"
+    )
+
+
+def test_search_language(make_app):
+    """The language is the one of the Sphinx search of the build."""
+    app = make_app(confoverrides={"language": "fr"})
+    assert get_search_language(app).lang == "fr"
+    assert get_text_normalizer(app).normalize("les paquets") == "paquet"
+
+    app = make_app(name="docs-de", confoverrides={"html_search_language": "de"})
+    assert get_search_language(app).lang == "de"
+
+
+def test_normalized_entries(make_app):
+    """Entries are matched on their normalized text and displayed with their text."""
+    app = make_app({"static_search": {"normalize": True}})
+    app.build()
+
+    search_index = json.loads((Path(app.outdir) / "_static" / "search.json").read_text())
+    entry = next(entry for entry in search_index if entry["href"].endswith("#installing"))
+    assert entry["text"] == "Installing\n\nInstalling the package requires Python."
+    assert entry["match"] == "instal instal packag requir python"
+
+
+def test_normalized_snippet(make_app):
+    """Only a snippet of the text of the normalized entries is kept for display."""
+    pages = {"index": "Long page\n=========\n\n" + "Searching the words. " * 100}
+    app = make_app({"static_search": {"normalize": True}}, pages=pages)
+    app.build()
+
+    (entry,) = json.loads((Path(app.outdir) / "_static" / "search.json").read_text())
+    assert len(entry["text"]) <= NORMALIZED_SNIPPET_LENGTH
+    assert entry["text"].startswith("Long page\n\nSearching the words.")
+    assert entry["match"] == "long page " + " ".join(["search word"] * 100)
@@ -0,0 +1,54 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the parallel build of the search index."""
+
+import json
+from pathlib import Path
+import shutil
+
+from ansys_sphinx_theme.search.cache import SEARCH_INDEX_CACHE_DIR
+from ansys_sphinx_theme.search.fuse_search import PARALLEL_MIN_DOCUMENTS
+
+
+def _build_search_index(make_app, nproc):
+    """Build the sample documentation, indexing every document at build-finished."""
+    theme_options = {"static_search": {"parallel": nproc}}
+    make_app(theme_options, name=f"docs-{nproc}").build()
+    # Without its cache, the next build indexes every document, none of them being
+    # written again
+    app = make_app(theme_options, name=f"docs-{nproc}")
+    shutil.rmtree(Path(app.doctreedir) / SEARCH_INDEX_CACHE_DIR)
+    app.build()
+    return app
+
+
+def test_parallel_build(make_app):
+    """The search index is the same whether it is built serially or in parallel."""
+    serial_app = _build_search_index(make_app, 1)
+    parallel_app = _build_search_index(make_app, 3)
+
+    # Enough documents are indexed for the parallel build to fork
+    assert 8 > PARALLEL_MIN_DOCUMENTS
+    for app in (serial_app, parallel_app):
+        assert "Updating the search index for 8 of 8 documents" in app.status.getvalue()
+    assert "in parallel" not in serial_app.status.getvalue()
+    assert "in parallel using 3 processes" in parallel_app.status.getvalue()
+
+    serial_index = (Path(serial_app.outdir) / "_static" / "search.json").read_text()
+    parallel_index = (Path(parallel_app.outdir) / "_static" / "search.json").read_text()
+    assert json.loads(serial_index)
+    assert parallel_index == serial_index
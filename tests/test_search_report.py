@@ -0,0 +1,88 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the report and of the size budget of the search index."""
+
+import json
+from pathlib import Path
+
+import pytest
+from sphinx.errors import ExtensionError
+
+from ansys_sphinx_theme.search.report import (
+    SEARCH_REPORT_FILE,
+    SearchIndexReport,
+    check_search_index_size,
+)
+
+
+def test_report():
+    """Entries and bytes are totaled per document and objectID."""
+    report = SearchIndexReport()
+    report.add("index", {"objectID": "Home", "href": "index.html#a", "title": "A", "text": ""})
+    report.add("guide", {"objectID": "Guide", "href": "guide.html#b", "title": "B", "text": "x"})
+    report.add("guide", {"objectID": "Guide", "href": "guide.html#c", "title": "C", "text": "y"})
+
+    content = report.as_dict({"search.json": 10})
+
+    assert content["entries"] == 3
+    assert content["files"] == {"search.json": 10}
+    assert [(total["document"], total["entries"]) for total in content["documents"]] == [
+        ("guide", 2),
+        ("index", 1),
+    ]
+    assert [total["objectID"] for total in content["objectIDs"]] == ["Guide", "Home"]
+    assert content["bytes"] == sum(total["bytes"] for total in content["documents"])
+    assert content["largest_entries"][0]["href"] == "guide.html#c"
+
+
+def test_report_build(make_app):
+    """The report lists every entry of the search index and its files."""
+    app = make_app({"static_search": {"report": True}})
+    app.build()
+
+    search_index = json.loads((Path(app.outdir) / "_static" / "search.json").read_text())
+    report = json.loads((Path(app.outdir) / SEARCH_REPORT_FILE).read_text())
+    assert report["entries"] == len(search_index)
+    assert "search.json" in report["files"]
+
+
+def test_size_budget_warning(make_app):
+    """Exceeding the budget emits a warning by default."""
+    app = make_app({"static_search": {"max_index_size": 100}})
+    app.build()
+
+    assert "exceeds the budget of 100 bytes" in app.warning.getvalue()
+
+
+def test_size_budget_error(make_app):
+    """Exceeding the budget fails the build with the error action."""
+    app = make_app({"static_search": {"max_index_size": 100, "max_index_size_action": "error"}})
+
+    with pytest.raises(ExtensionError, match="exceeds the budget of 100 bytes"):
+        app.build()
+
+
+def test_size_budget_met():
+    """Nothing happens when the budget is met or not set."""
+    check_search_index_size(100, 100, "error")
+    check_search_index_size(100, None, "error")
+
+
+def test_invalid_action():
+    """Invalid actions are rejected, even when the budget is met."""
+    with pytest.raises(ValueError, match="Invalid 'max_index_size_action': 'warn'"):
+        check_search_index_size(10, 100, "warn")
@@ -0,0 +1,194 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the extraction of the sections of a document."""
+
+import copy
+
+from docutils import nodes
+from docutils.nodes import Element
+import pytest
+
+from ansys_sphinx_theme.search.fuse_search import UNWANTED_NODE_TYPES, SearchIndex, _title_to_anchor
+
+PAGES = {
+    "index": """
+Home
+====
+
+Welcome home.
+
+.. toctree::
+
+   walk
+""",
+    "walk": """
+Walk
+====
+
+Introduction of the page with *emphasis*.
+
+.. code-block:: python
+
+   print("hidden code")
+
+The energy is :math:`e = mc^2`.
+
+.. A hidden comment
+
+First
+-----
+
+Text of the first section.
+
+.. py:class:: sample.Task
+
+   A task to run.
+
+   .. py:method:: run()
+
+      Run the task.
+
+Nested
+~~~~~~
+
+Text of the nested section.
+
+.. py:function:: sample.helper()
+
+   Help the tasks.
+
+Second
+------
+
+Text of the second section.
+""",
+}
+
+
+@pytest.fixture
+def app(make_app):
+    """Build the sample documentation."""
+    app = make_app(pages=PAGES)
+    app.build()
+    return app
+
+
+def _sections(app, docname, doctree):
+    """Extract the sections of a document."""
+    search_index = SearchIndex(docname, app, doctree=doctree)
+    search_index.build_sections()
+    return search_index.sections
+
+
+def _baseline_sections(doctree):
+    """Extract the sections like the walk copying and modifying the doctree did."""
+    sections = []
+    for node in list(doctree.findall(nodes.section)):
+        subsections = list(node.findall(nodes.section))
+        if len(subsections) > 1:
+            main_section = subsections[0]
+            for subsection in list(main_section.findall(nodes.section)):
+                subsection.parent.remove(subsection)
+            node = main_section
+        section_title = node[0].astext()
+        unwanted_nodes = [n for n in node.findall() if isinstance(n, UNWANTED_NODE_TYPES)]
+        for unwanted_node in unwanted_nodes:
+            if unwanted_node.parent:
+                unwanted_node.parent.remove(unwanted_node)
+        sections.append(
+            {
+                "title": section_title,
+                "text": node.astext(),
+                "anchor_id": _title_to_anchor(section_title),
+            }
+        )
+        for element in node.findall(Element):
+            if element.tagname != "desc":
+                continue
+            anchor_id = element.attributes.get("ids", [])
+            for child in element.children:
+                if child.tagname == "desc_signature" and child.attributes.get("ids"):
+                    anchor_id = child.attributes["ids"]
+            if anchor_id:
+                sections.append(
+                    {
+                        "title": f"{section_title} > {anchor_id[0].split('.')[-1]}",
+                        "text": element.astext(),
+                        "anchor_id": anchor_id[0],
+                    }
+                )
+    return sections
+
+
+def test_nested_sections(app):
+    """Each section has its own entry, without the text of its subsections."""
+    sections = _sections(app, "walk", app.env.get_doctree("walk"))
+    texts = {section["title"]: section["text"] for section in sections}
+
+    assert [section["title"] for section in sections if section["kind"] == "section"] == [
+        "Walk",
+        "First",
+        "Nested",
+        "Second",
+    ]
+    assert "Introduction of the page" in texts["Walk"]
+    assert "Text of the first section" not in texts["Walk"]
+    assert "Text of the first section" in texts["First"]
+    assert "Text of the nested section" not in texts["First"]
+    assert "Help the tasks" not in texts["First"]
+    assert texts["Nested"].startswith("Nested")
+
+
+def test_skipped_nodes(app):
+    """Tables of contents and unwanted node types are not indexed."""
+    resolved_doctree = app.env.get_and_resolve_doctree("index", app.builder, tags=app.tags)
+    assert "Walk" in resolved_doctree.astext()
+    (home,) = _sections(app, "index", resolved_doctree)
+    assert home["text"].strip() == "Home\n\nWelcome home."
+
+    walk = _sections(app, "walk", app.env.get_doctree("walk"))[0]
+    assert "hidden code" not in walk["text"]
+    assert "The energy is ." in walk["text"]
+    assert "mc^2" not in walk["text"]
+    assert "hidden comment" not in walk["text"]
+
+
+def test_desc_entries(app):
+    """API objects have entries titled after their section and their name."""
+    sections = _sections(app, "walk", app.env.get_doctree("walk"))
+    descs = [section for section in sections if section["kind"] == "desc"]
+
+    assert [(desc["title"], desc["anchor_id"]) for desc in descs] == [
+        ("First > Task", "sample.Task"),
+        ("First > run", "sample.Task.run"),
+        ("Nested > helper", "sample.helper"),
+    ]
+    # The text of a class contains the text of its methods
+    assert "Run the task" in descs[0]["text"]
+
+
+def test_baseline(app):
+    """The entries are the ones of the walk modifying a copy of the doctree."""
+    doctree = app.env.get_doctree("walk")
+    expected = _baseline_sections(copy.deepcopy(doctree))
+    before = doctree.pformat()
+
+    sections = _sections(app, "walk", doctree)
+
+    assert [{key: section[key] for key in expected[0]} for section in sections] == expected
+    # The doctree is not modified
+    assert doctree.pformat() == before
@@ -0,0 +1,134 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the index of the API symbols."""
+
+import json
+from pathlib import Path
+
+from ansys_sphinx_theme.search.symbols import SymbolIndexBuilder
+from ansys_sphinx_theme.search.writers import SEARCH_INDEX_DIR, SEARCH_MANIFEST_FILE
+
+PAGES = {
+    "index": """
+API
+===
+
+.. py:module:: mypkg
+
+.. py:class:: Task
+
+   A task.
+
+   .. py:method:: run()
+
+      Run the task.
+
+.. py:function:: helper()
+
+   Help.
+
+Other
+-----
+
+.. py:currentmodule:: None
+
+.. py:function:: standalone()
+
+   Without a module.
+""",
+}
+
+
+def decode(index):
+    """Rebuild the symbols of a symbol index, like ``SymbolIndex`` in ``search-utils.js``."""
+    symbols = []
+    for name, module, objtype, document, anchor in index["symbols"]:
+        symbols.append(
+            {
+                "name": f"{index['modules'][module]}.{name}" if module != -1 else name,
+                "module": index["modules"][module] if module != -1 else "",
+                "type": index["types"][objtype],
+                "href": f"{index['documents'][document]}#{anchor}",
+            }
+        )
+    return symbols
+
+
+def test_round_trip():
+    """Symbols are sorted by full name regardless of case."""
+    builder = SymbolIndexBuilder()
+    builder.add("api/foo.html#ansys.foo.Zeta", "Zeta", "ansys.foo", "class")
+    builder.add("api/foo.html#ansys.foo.alpha", "alpha", "ansys.foo", "function")
+    builder.add("api/bar.html#ansys.bar.Étoile", "Étoile", "ansys.bar", "class")
+    builder.add("api/c.html#c.run", "c_run", "", "function")
+
+    index = builder.build()
+
+    assert index["modules"] == ["ansys.foo", "ansys.bar"]
+    assert index["documents"] == ["api/foo.html", "api/bar.html", "api/c.html"]
+    assert decode(index) == [
+        {
+            "name": "ansys.bar.Étoile",
+            "module": "ansys.bar",
+            "type": "class",
+            "href": "api/bar.html#ansys.bar.Étoile",
+        },
+        {
+            "name": "ansys.foo.alpha",
+            "module": "ansys.foo",
+            "type": "function",
+            "href": "api/foo.html#ansys.foo.alpha",
+        },
+        {
+            "name": "ansys.foo.Zeta",
+            "module": "ansys.foo",
+            "type": "class",
+            "href": "api/foo.html#ansys.foo.Zeta",
+        },
+        {"name": "c_run", "module": "", "type": "function", "href": "api/c.html#c.run"},
+    ]
+
+
+def test_symbol_index(make_app):
+    """The symbols described in the documents are written in the symbol index."""
+    app = make_app({"static_search": {"symbol_index": True}}, pages=PAGES)
+    app.build()
+
+    search_dir = Path(app.outdir) / "_static" / SEARCH_INDEX_DIR
+    manifest = json.loads((search_dir / SEARCH_MANIFEST_FILE).read_text())
+    index = json.loads((search_dir / manifest["symbols"]).read_text())
+    assert decode(index) == [
+        {
+            "name": "mypkg.helper",
+            "module": "mypkg",
+            "type": "function",
+            "href": "index.html#mypkg.helper",
+        },
+        {"name": "mypkg.Task", "module": "mypkg", "type": "class", "href": "index.html#mypkg.Task"},
+        {
+            "name": "mypkg.Task.run",
+            "module": "mypkg",
+            "type": "method",
+            "href": "index.html#mypkg.Task.run",
+        },
+        {
+            "name": "standalone",
+            "module": "",
+            "type": "function",
+            "href": "index.html#standalone",
+        },
+    ]
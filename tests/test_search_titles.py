@@ -0,0 +1,89 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the index completing the titles of the sections."""
+
+import json
+from pathlib import Path
+
+from ansys_sphinx_theme.search.titles import TitleIndexBuilder
+from ansys_sphinx_theme.search.writers import SEARCH_INDEX_DIR, SEARCH_MANIFEST_FILE
+
+
+def decode(index):
+    """Rebuild the sections of a title index, like ``TitleIndex`` in ``search-utils.js``."""
+    sections = []
+    previous = b""
+    for shared, suffix, document, anchor, prefix in index["titles"]:
+        # Titles are sliced in UTF-16 code units, like JavaScript strings
+        title = previous[: shared * 2].decode("utf-16-le") + suffix
+        previous = title.encode("utf-16-le")
+        sections.append(
+            {
+                "title": title,
+                "href": f"{index['documents'][document]}#{anchor}",
+                "prefix": index["prefixes"][prefix] if prefix != -1 else "",
+            }
+        )
+    return sections
+
+
+def test_round_trip():
+    """Titles are sorted regardless of case and front-coded in UTF-16 code units."""
+    sections = [
+        ("guide.html#cafe", "Café", "Guide > Café"),
+        ("guide.html#cafeine", "Caféine", "Guide > Caféine"),
+        ("emoji.html#smile-a", "😀 a", "😀 a"),
+        ("emoji.html#smile-b", "😀 b", "Emoji > 😀 b"),
+        ("emoji.html#grin", "😃", "Emoji > 😃"),
+        ("index.html#examples", "Examples", "Home > Examples"),
+        ("guide.html#examples", "examples", "Guide > examples"),
+    ]
+    builder = TitleIndexBuilder()
+    for href, title, breadcrumbs in sections:
+        builder.add(href, title, breadcrumbs)
+
+    index = builder.build()
+
+    assert decode(index) == [
+        {"title": "Café", "href": "guide.html#cafe", "prefix": "Guide"},
+        {"title": "Caféine", "href": "guide.html#cafeine", "prefix": "Guide"},
+        {"title": "Examples", "href": "index.html#examples", "prefix": "Home"},
+        {"title": "examples", "href": "guide.html#examples", "prefix": "Guide"},
+        {"title": "😀 a", "href": "emoji.html#smile-a", "prefix": ""},
+        {"title": "😀 b", "href": "emoji.html#smile-b", "prefix": "Emoji"},
+        {"title": "😃", "href": "emoji.html#grin", "prefix": "Emoji"},
+    ]
+    # The emoji and the space are three UTF-16 code units
+    assert index["titles"][5][:2] == [3, "b"]
+    assert index["titles"][1][:2] == [4, "ine"]
+
+
+def test_title_index(make_app):
+    """The titles of the sections are written in the title index."""
+    app = make_app({"static_search": {"title_index": True}})
+    app.build()
+
+    search_dir = Path(app.outdir) / "_static" / SEARCH_INDEX_DIR
+    manifest = json.loads((search_dir / SEARCH_MANIFEST_FILE).read_text())
+    sections = decode(json.loads((search_dir / manifest["titles"]).read_text()))
+    titles = [section["title"] for section in sections]
+    assert titles == sorted(titles, key=lambda title: (title.lower(), title))
+    assert {
+        "title": "From sources",
+        "href": "guide/install.html#from-sources",
+        "prefix": "Installing",
+    } in sections
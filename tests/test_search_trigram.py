@@ -0,0 +1,46 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the trigram index."""
+
+from ansys_sphinx_theme.search.trigram import TrigramIndexBuilder, trigrams
+
+ENTRIES = [
+    {"title": "Installing", "text": "Install the package with pip."},
+    {"title": "Usage", "text": "Import the package."},
+    {"title": "Theme options", "text": "Options of the theme, such as the logo."},
+]
+
+
+def test_trigrams():
+    """Terms are padded with spaces before being split into trigrams."""
+    assert trigrams("Pip") == {" pi", "pip", "ip "}
+    assert trigrams("a b") == {" a ", " b "}
+
+
+def test_trigram_postings():
+    """Each trigram lists the entries containing it as deltas of positions."""
+    builder = TrigramIndexBuilder()
+    for entry in ENTRIES:
+        builder.add(entry)
+
+    index = builder.build()
+    postings = dict(zip(index["trigrams"], index["postings"]))
+
+    assert index["trigrams"] == sorted(index["trigrams"])
+    assert postings["pac"] == [0, 1]
+    assert postings[" th"] == [0, 1, 1]
+    assert postings["log"] == [2]
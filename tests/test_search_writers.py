@@ -0,0 +1,76 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the writers of the search index files."""
+
+import json
+
+from ansys_sphinx_theme.search.writers import (
+    CONTENT_HASH_LENGTH,
+    SEARCH_INDEX_DIR,
+    SEARCH_MANIFEST_FILE,
+    content_address,
+    write_search_file,
+    write_search_manifest,
+)
+
+
+def test_content_address(tmp_path):
+    """Files are renamed after their content."""
+    first_path = tmp_path / "search.json"
+    first_path.write_text("[1]")
+    first_name = content_address(first_path)
+
+    stem, digest, suffix = first_name.split(".")
+    assert (stem, suffix) == ("search", "json")
+    assert len(digest) == CONTENT_HASH_LENGTH
+    assert not first_path.exists()
+    assert (tmp_path / first_name).read_text() == "[1]"
+
+    # The same content gets the same name, another content a new one
+    first_path.write_text("[1]")
+    assert content_address(first_path) == first_name
+    assert not first_path.exists()
+    first_path.write_text("[2]")
+    assert content_address(first_path) != first_name
+
+
+def test_manifest_pruning(tmp_path):
+    """Files of the previous manifest are removed with their compressed siblings."""
+    search_dir = tmp_path / SEARCH_INDEX_DIR
+    old_name = write_search_file(tmp_path, "bm25.json", {"terms": ["old"]})
+    kept_name = write_search_file(tmp_path, "search.json", [])
+    old_shard = write_search_file(tmp_path, "shard-0.json", [])
+    for suffix in (".gz", ".br"):
+        (search_dir / f"{old_name}{suffix}").write_bytes(b"compressed")
+    write_search_manifest(
+        tmp_path,
+        {
+            "version": 1,
+            "search": kept_name,
+            "bm25": old_name,
+            "shards": [{"path": old_shard, "prefix": "guide"}],
+        },
+    )
+
+    new_name = write_search_file(tmp_path, "bm25.json", {"terms": ["new"]})
+    manifest = {"version": 1, "search": kept_name, "bm25": new_name}
+    write_search_manifest(tmp_path, manifest)
+
+    assert sorted(path.name for path in search_dir.iterdir()) == sorted(
+        [SEARCH_MANIFEST_FILE, kept_name, new_name]
+    )
+    assert json.loads((search_dir / SEARCH_MANIFEST_FILE).read_text()) == manifest